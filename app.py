@@ -1,8 +1,14 @@
 import streamlit as st
-import pandas as pd
-import os
 import hashlib
 
+from scandidai.config import ADMIN_USERS
+from scandidai.jobs import all_jobs
+from scandidai.metrics import render_prometheus, snapshot, start_metrics_server, timed, timer
+from scandidai.model import ATS_MODEL_KEY, is_ats_model_loaded
+from scandidai.results_store import cascade_stats
+from scandidai.screening_queue import live_workers, queue_stats
+from scandidai.users import get_user_repository
+
 # ===== Page Configuration =====
 st.set_page_config(
     page_title="ScandidAI Login",
@@ -135,23 +141,18 @@ def verify_password(password, hashed):
 
 # ===== User Data Storage =====
 USER_FILE = "users.csv"
+user_repository = get_user_repository(USER_FILE)
 
 def init_user_file():
-    if not os.path.exists(USER_FILE):
-        pd.DataFrame(columns=["username", "password", "email"]).to_csv(USER_FILE, index=False)
+    user_repository.init_file()
 
+@timed("load_users")
 def load_users():
-    return pd.read_csv(USER_FILE)
+    # {username: record}, dibaca ulang dari disk hanya kalau users.csv berubah
+    return user_repository.load()
 
 def save_user(username, password, email):
-    users_df = load_users()
-    new_user = pd.DataFrame({
-        "username": [username],
-        "password": [hash_password(password)],
-        "email": [email]
-    })
-    users_df = pd.concat([users_df, new_user], ignore_index=True)
-    users_df.to_csv(USER_FILE, index=False)
+    return user_repository.add(username, hash_password(password), email)
 
 # ===== Session State Initialization =====
 if "logged_in" not in st.session_state:
@@ -174,10 +175,11 @@ def show_login_page():
         col1, col2 = st.columns(2)
         with col1:
             if st.button("Login", use_container_width=True):
-                users_df = load_users()
-                if username in users_df["username"].values:
-                    stored_password = users_df[users_df["username"] == username]["password"].values[0]
-                    if verify_password(password, stored_password):
+                with timer("login"):
+                    user = load_users().get(username)
+                    password_ok = user is not None and verify_password(password, user["password"])
+                if user is not None:
+                    if password_ok:
                         st.session_state.logged_in = True
                         st.session_state.username = username
                         st.session_state.current_page = "dashboard"
@@ -212,11 +214,9 @@ def show_register_page():
             elif password != password_confirm:
                 st.error("Passwords do not match!")
             else:
-                users_df = load_users()
-                if username in users_df["username"].values:
+                if not save_user(username, password, email):
                     st.error("Username already exists!")
                 else:
-                    save_user(username, password, email)
                     st.success("Registration successful! Please log in.")
                     st.session_state.current_page = "login"
                     st.rerun()
@@ -233,8 +233,6 @@ def show_dashboard():
     
     st.subheader("Home")
     
-    col1, col2, col3 = st.columns(3)
-    
     container_style = """
     <style>
         .stContainer > div:first-child {
@@ -247,27 +245,30 @@ def show_dashboard():
     """
     st.markdown(container_style, unsafe_allow_html=True)
     
-    with col1:
+    # Satu kartu per job di scandidai/job_data.py, tiga per baris
+    jobs = all_jobs()
+    columns = st.columns(3)
+    
+    with columns[0]:
         with st.container(border=True):
             st.markdown("## Job List")
             st.write("List of available job vacancies")
             if st.button("Open", key="joblist_btn"):
                 st.switch_page("pages/joblist.py")
     
-    with col2:
-        with st.container(border=True):
-            st.markdown("## Apply Data Engineer")
-            st.write("Submit your resume to the Data Engineer role")
-            if st.button("Open", key="scandidai_de_btn"):
-                st.switch_page("pages/scandidai_de.py")
-    
-    with col3:
-        with st.container(border=True):
-            st.markdown("## Apply Data Scientist")
-            st.write("Submit your resume to the Data Scientist role")
-            if st.button("Open", key="scandidai_ds_btn"):
-                st.switch_page("pages/scandidai_ds.py")
+    for i, job in enumerate(jobs, start=1):
+        if i % 3 == 0:
+            columns = st.columns(3)
+        with columns[i % 3]:
+            with st.container(border=True):
+                st.markdown(f"## Apply {job.title}")
+                st.write(f"Submit your resume to the {job.title} role")
+                if st.button("Open", key=f"apply_{job.id}_btn"):
+                    st.switch_page("pages/screening.py", query_params={"job": job.id})
     
+    if st.session_state.username in ADMIN_USERS:
+        show_metrics_panel()
+
     st.divider()
     if st.button("Logout", type="primary"):
         st.session_state.logged_in = False
@@ -275,8 +276,42 @@ def show_dashboard():
         st.session_state.current_page = "login"
         st.rerun()
 
+def show_metrics_panel():
+    with st.expander("📈 Metrics (admin)"):
+        stats = queue_stats()
+        st.write(
+            f"Screening queue: {stats['queued']} queued, {stats['running']} running, "
+            f"{stats['done']} done, {stats['fast_rejected']} fast-rejected, {stats['failed']} failed · "
+            f"{len(live_workers())} worker(s) online"
+        )
+        # Model di-load lazy oleh submission pertama (embedded worker)
+        model_state = "loaded" if is_ats_model_loaded() else "not loaded yet"
+        st.write(f"ATS model `{ATS_MODEL_KEY}`: {model_state} in this server process")
+        # LLM call yang dihemat cascade, dari semua hasil tersimpan
+        cascade = cascade_stats()
+        screened = cascade["evaluated"] + cascade["fast_rejected"]
+        if screened:
+            st.write(
+                f"Scoring cascade: {cascade['fast_rejected']} of {screened} results fast-rejected "
+                f"({cascade['fast_rejected'] / screened:.0%} of LLM calls avoided)"
+            )
+        timers, counters = snapshot()
+        if timers:
+            st.dataframe(timers, hide_index=True, use_container_width=True)
+        else:
+            st.write("No timings recorded yet.")
+        if counters:
+            st.write(counters)
+        st.download_button(
+            label="Download Prometheus metrics",
+            data=render_prometheus(),
+            file_name="scandidai_metrics.prom",
+            mime="text/plain",
+        )
+
 # ===== Main App =====
 def main():
+    start_metrics_server()
     init_user_file()
     
     if not st.session_state.logged_in:
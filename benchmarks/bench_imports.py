@@ -0,0 +1,73 @@
+# bench_imports.py
+# Mengukur waktu import halaman screening sampai form bisa dirender, di
+# interpreter baru (cold), dan memastikan modul berat tidak ikut ter-import.
+#
+#   python benchmarks/bench_imports.py
+#   python benchmarks/bench_imports.py --budget-ms 1500
+#
+# Exit code 1 kalau ada modul berat yang ter-import atau waktu melewati budget.
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGES = [
+    "app.py", "pages/screening.py", "pages/joblist.py", "pages/candidate_search.py", "pages/bulk_intake.py",
+]
+
+# Modul yang hanya boleh di-import saat submission diproses
+HEAVY_MODULES = ["sentence_transformers", "torch", "transformers", "sklearn", "groq", "pdfminer", "PIL", "pandas", "numpy"]
+
+def top_level_imports(path):
+    # Import yang dijalankan saat halaman dibuka: statement import di level
+    # module (bukan di dalam if/def).
+    with open(os.path.join(ROOT, path), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    statements = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            statements.append(ast.unparse(node))
+    return statements
+
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+started = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - started
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"import_ms": elapsed * 1000, "heavy": heavy}}))
+"""
+
+def measure(path, repeats):
+    imports = "\n".join(top_level_imports(path))
+    code = PROBE.format(root=ROOT, imports=imports, heavy=HEAVY_MODULES)
+    runs = []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    best = min(run["import_ms"] for run in runs)
+    heavy = sorted({name for run in runs for name in run["heavy"]})
+    return best, heavy
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold import-time check for the Streamlit pages")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--budget-ms", type=float, default=2000.0, help="max import time per page")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'page':<26}{'import ms':>12}  heavy modules")
+    for page in PAGES:
+        best, heavy = measure(page, args.repeats)
+        over_budget = best > args.budget_ms
+        failed = failed or bool(heavy) or over_budget
+        flag = "  OVER BUDGET" if over_budget else ""
+        print(f"{page:<26}{best:>12.1f}  {', '.join(heavy) or '-'}{flag}")
+    sys.exit(1 if failed else 0)
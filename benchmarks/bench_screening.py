@@ -0,0 +1,247 @@
+# bench_screening.py
+# Benchmark end-to-end screening: PDF -> teks -> embedding -> report (mock
+# Groq) -> extract_scores -> simpan hasil -> ranking, dengan waktu per stage.
+#
+#   python benchmarks/bench_screening.py --samples 30
+#   python benchmarks/bench_screening.py --compare benchmarks/results/<run>.json
+#
+# Semua cache/database diarahkan ke folder sementara supaya setiap run
+# mengukur kondisi cold yang sama.
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+STAGES = ["extract_pdf", "similarity", "report", "extract_scores", "save_result", "ranking"]
+BENCH_JOB = "benchmark"
+
+# ===== Sample PDFs =====
+def _pdf_escape(text):
+    text = text.encode("latin-1", "replace").decode("latin-1")
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def _wrap(text, width=95):
+    lines = []
+    for paragraph in text.splitlines() or [""]:
+        words = paragraph.split()
+        line = ""
+        for word in words:
+            if line and len(line) + len(word) + 1 > width:
+                lines.append(line)
+                line = word
+            else:
+                line = f"{line} {word}".strip()
+        lines.append(line)
+    return lines
+
+def write_text_pdf(path, text, lines_per_page=60):
+    # PDF minimal (Helvetica, teks saja) supaya tidak perlu library tambahan
+    lines = _wrap(text)
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    objects = ["<</Type/Catalog/Pages 2 0 R>>", None, "<</Type/Font/Subtype/Type1/BaseFont/Helvetica>>"]
+    page_ids = []
+    for page_lines in pages:
+        content = "BT /F1 9 Tf 40 800 Td 11 TL " + " ".join(f"({_pdf_escape(line)}) '" for line in page_lines) + " ET"
+        objects.append(f"<</Length {len(content.encode('latin-1'))}>>\nstream\n{content}\nendstream")
+        content_id = len(objects)
+        objects.append(f"<</Type/Page/Parent 2 0 R/MediaBox[0 0 595 842]/Contents {content_id} 0 R/Resources<</Font<</F1 3 0 R>>>>>>")
+        page_ids.append(len(objects))
+    objects[1] = f"<</Type/Pages/Kids[{' '.join(f'{i} 0 R' for i in page_ids)}]/Count {len(page_ids)}>>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode("latin-1")
+    out += f"trailer\n<</Size {len(objects) + 1}/Root 1 0 R>>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    with open(path, "wb") as f:
+        f.write(out)
+
+def generate_sample_pdfs(pdf_dir, samples):
+    # Sampel tetap: baris pertama ResumeDataSet.csv, jadi hasil antar commit
+    # bisa dibandingkan.
+    import pandas as pd
+
+    os.makedirs(pdf_dir, exist_ok=True)
+    resumes = pd.read_csv(os.path.join(ROOT, "ResumeDataSet.csv"), nrows=samples)
+    paths = []
+    for i, text in enumerate(resumes["Resume"]):
+        path = os.path.join(pdf_dir, f"resume_{i:03d}.pdf")
+        if not os.path.exists(path):
+            write_text_pdf(path, text)
+        paths.append(path)
+    return paths
+
+# ===== Stats =====
+def percentile(values, q):
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    index = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+def summarize(values):
+    return {
+        "count": len(values),
+        "mean_ms": sum(values) / len(values) * 1000 if values else None,
+        "p50_ms": percentile(values, 50) * 1000 if values else None,
+        "p95_ms": percentile(values, 95) * 1000 if values else None,
+        "p99_ms": percentile(values, 99) * 1000 if values else None,
+    }
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except Exception:
+        return None
+
+# ===== Run =====
+def run(args):
+    workdir = tempfile.mkdtemp(prefix="scandidai-bench-")
+    os.environ["SCANDIDAI_CACHE_DIR"] = os.path.join(workdir, "cache")
+    os.environ["SCANDIDAI_RESULTS_DB"] = os.path.join(workdir, "results.db")
+    os.environ["SCANDIDAI_REPORT_STORE_DIR"] = os.path.join(workdir, "reports")
+
+    from scandidai.mock_groq import start_in_background
+
+    server, base_url = start_in_background(
+        port=0, latency=args.llm_latency, chars_per_second=args.llm_chars_per_second, quiet=True
+    )
+    os.environ["GROQ_BASE_URL"] = base_url
+    os.environ["GROQ_API_KEY"] = "mock"
+    # Budget token Groq asli tidak relevan untuk mock; tanpa ini stage report
+    # ikut mengukur waktu tunggu token bucket.
+    os.environ["SCANDIDAI_LLM_TOKENS_PER_MINUTE"] = str(args.llm_tokens_per_minute)
+
+    # Import setelah env di atas di-set, karena config dibaca saat import
+    from scandidai.job_data import jobs
+    from scandidai.leaderboard import get_leaderboard
+    from scandidai.model import get_ats_model
+    from scandidai.pdf_extract import extract_pdf_bytes
+    from scandidai.report import extract_scores, get_report
+    from scandidai.results_store import add_result
+    from scandidai.scoring import calculate_similarity_bert
+
+    pdf_paths = generate_sample_pdfs(args.pdf_dir, args.samples)
+    job_desc = jobs[0]["description"]
+    answer = "I have built data pipelines and dashboards with SQL and Power BI."
+
+    started = time.perf_counter()
+    get_ats_model()
+    calculate_similarity_bert("warm up", job_desc)
+    model_load = time.perf_counter() - started
+
+    timings = {stage: [] for stage in STAGES + ["total"]}
+    for i, path in enumerate(pdf_paths):
+        with open(path, "rb") as f:
+            data = f.read()
+        stage_times = {}
+
+        t = time.perf_counter()
+        resume_text = extract_pdf_bytes(data)
+        stage_times["extract_pdf"] = time.perf_counter() - t
+        combined_text = resume_text + "\n\nOpen Question Answer:\n" + answer
+
+        t = time.perf_counter()
+        ats_score = calculate_similarity_bert(combined_text, job_desc)
+        stage_times["similarity"] = time.perf_counter() - t
+
+        t = time.perf_counter()
+        report = get_report(combined_text, job_desc)
+        stage_times["report"] = time.perf_counter() - t
+
+        t = time.perf_counter()
+        scores = extract_scores(report)
+        avg_score = sum(scores) / (10 * len(scores)) if scores else 0
+        stage_times["extract_scores"] = time.perf_counter() - t
+
+        t = time.perf_counter()
+        add_result(BENCH_JOB, {
+            "username": f"bench_{i}",
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "bert_score": round(ats_score, 2),
+            "groq_score": round(avg_score, 2),
+            "final_score": round((ats_score + avg_score) / 2, 2),
+            "report": report,
+        }, submission_id=f"bench-{i}")
+        stage_times["save_result"] = time.perf_counter() - t
+
+        t = time.perf_counter()
+        leaderboard = get_leaderboard(BENCH_JOB)
+        leaderboard.rank(round((ats_score + avg_score) / 2, 2))
+        leaderboard.top()
+        stage_times["ranking"] = time.perf_counter() - t
+
+        for stage, value in stage_times.items():
+            timings[stage].append(value)
+        timings["total"].append(sum(stage_times.values()))
+
+    server.shutdown()
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "samples": len(pdf_paths),
+        "llm_latency_s": args.llm_latency,
+        "model_load_ms": model_load * 1000,
+        "stages": {stage: summarize(values) for stage, values in timings.items()},
+    }
+
+# ===== Output =====
+def print_table(result, baseline=None):
+    print(f"commit {result['commit']}  samples {result['samples']}  model load {result['model_load_ms']:.0f} ms")
+    header = f"{'stage':<16}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    if baseline:
+        header += f"{'Δp50':>10}{'Δp95':>10}"
+    print(header)
+    for stage, stats in result["stages"].items():
+        line = f"{stage:<16}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}"
+        base = baseline["stages"].get(stage) if baseline else None
+        if base:
+            line += f"{stats['p50_ms'] - base['p50_ms']:>+10.1f}{stats['p95_ms'] - base['p95_ms']:>+10.1f}"
+        print(line)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="End-to-end screening benchmark")
+    parser.add_argument("--samples", type=int, default=30)
+    parser.add_argument("--pdf-dir", default=os.path.join(ROOT, "benchmarks", "sample_pdfs"),
+                        help="folder of sample PDFs (generated from ResumeDataSet.csv if missing)")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="mock Groq latency in seconds")
+    parser.add_argument("--llm-chars-per-second", type=float, default=0, help="mock streaming speed")
+    parser.add_argument("--llm-tokens-per-minute", type=int, default=10_000_000,
+                        help="scheduler token budget while benchmarking")
+    parser.add_argument("--output", help="JSON output path (default benchmarks/results/<time>-<commit>.json)")
+    parser.add_argument("--compare", help="previous JSON result to diff against")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    result = run(args)
+
+    output = args.output
+    if output is None:
+        name = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{result['commit'] or 'nogit'}.json"
+        output = os.path.join(ROOT, "benchmarks", "results", name)
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(result, f, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_table(result, baseline)
+    print(f"saved {output}")
@@ -0,0 +1,169 @@
+# compare_backends.py
+# Membandingkan backend embedding untuk ATS score: waktu load, latency encode,
+# RSS, dan drift skor terhadap baseline (torch fp32, all-mpnet-base-v2 =
+# output calculate_similarity_bert saat ini) pada dataset resume bawaan.
+#
+#   python benchmarks/compare_backends.py --samples 200
+#   python benchmarks/compare_backends.py --configs torch,torch-int8,onnx-int8,torch:sentence-transformers/all-MiniLM-L6-v2
+#
+# Tiap konfigurasi dijalankan di proses terpisah supaya RSS-nya terukur bersih.
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+DEFAULT_MODEL = "sentence-transformers/all-mpnet-base-v2"
+DEFAULT_CONFIGS = "torch,torch-int8,onnx,onnx-int8,torch:sentence-transformers/all-MiniLM-L6-v2"
+
+def parse_config(config):
+    backend, _, model_name = config.partition(":")
+    return backend, model_name or DEFAULT_MODEL
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage / 1024 / 1024 if sys.platform == "darwin" else usage / 1024
+
+def load_sample_texts(samples):
+    # Campuran kedua bagian dataset: baris ResumeDataSet (Resume Text asli)
+    # dan baris AI_Resume_Screening (teks disusun dari kolom profil).
+    import pandas as pd
+
+    from scandidai.batch import resume_text_from_row
+    from scandidai.dataset import load_dataset
+
+    df = load_dataset()
+    has_text = df["Resume Text"].notna()
+    half = samples // 2
+    picked = pd.concat([df[has_text].head(samples - half), df[~has_text].head(half)])
+    return [resume_text_from_row(row) for row in picked.to_dict("records")]
+
+# ===== Worker: satu konfigurasi =====
+def run_worker(backend, model_name, samples, scores_path):
+    os.environ["SCANDIDAI_EMBEDDING_BACKEND"] = backend
+    os.environ["SCANDIDAI_EMBEDDING_MODEL"] = model_name
+    os.environ["SCANDIDAI_CACHE_DIR"] = tempfile.mkdtemp(prefix="scandidai-backend-")
+
+    from scandidai.job_data import jobs
+    from scandidai.model import get_ats_model
+    from scandidai.scoring import calculate_similarity_bert, calculate_similarity_bert_batch
+
+    texts = load_sample_texts(samples)
+    job_descs = [job["description"] for job in jobs]
+    rss_before = peak_rss_mb()
+
+    started = time.perf_counter()
+    get_ats_model()
+    load_s = time.perf_counter() - started
+    calculate_similarity_bert("warm up", job_descs[0])
+
+    single = []
+    for text in texts[:20]:
+        started = time.perf_counter()
+        calculate_similarity_bert(text + " ", job_descs[0])
+        single.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    scores = calculate_similarity_bert_batch(texts, job_descs, batch_size=32)
+    batch_s = time.perf_counter() - started
+    np.save(scores_path, scores)
+
+    return {
+        "backend": backend,
+        "model": model_name,
+        "load_s": load_s,
+        "single_p50_ms": float(np.median(single) * 1000),
+        "batch_resumes_per_s": len(texts) / batch_s,
+        "rss_before_model_mb": rss_before,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+# ===== Drift =====
+def rank_correlation(a, b):
+    rank_a = np.argsort(np.argsort(a))
+    rank_b = np.argsort(np.argsort(b))
+    return float(np.corrcoef(rank_a, rank_b)[0, 1])
+
+def drift(baseline, scores, top_k=10):
+    columns = []
+    for j in range(baseline.shape[1]):
+        top_base = set(np.argsort(-baseline[:, j])[:top_k])
+        top_new = set(np.argsort(-scores[:, j])[:top_k])
+        columns.append({
+            "mean_abs_diff": float(np.mean(np.abs(baseline[:, j] - scores[:, j]))),
+            "max_abs_diff": float(np.max(np.abs(baseline[:, j] - scores[:, j]))),
+            "spearman": rank_correlation(baseline[:, j], scores[:, j]),
+            f"top{top_k}_overlap": len(top_base & top_new) / top_k,
+        })
+    # Rata-rata semua job
+    return {key: float(np.mean([column[key] for column in columns])) for key in columns[0]}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare ATS embedding backends")
+    parser.add_argument("--configs", default=DEFAULT_CONFIGS,
+                        help="comma separated backend[:model]; the first is the baseline")
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--worker", nargs=3, metavar=("BACKEND", "MODEL", "SCORES_PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        backend, model_name, scores_path = args.worker
+        print(json.dumps(run_worker(backend, model_name, args.samples, scores_path)))
+        sys.exit(0)
+
+    configs = [parse_config(config) for config in args.configs.split(",")]
+    if configs[0] != ("torch", DEFAULT_MODEL):
+        configs.insert(0, ("torch", DEFAULT_MODEL))
+
+    workdir = tempfile.mkdtemp(prefix="scandidai-compare-")
+    results = []
+    baseline_scores = None
+    for backend, model_name in configs:
+        scores_path = os.path.join(workdir, f"{len(results)}.npy")
+        process = subprocess.run(
+            [sys.executable, __file__, "--samples", str(args.samples), "--worker", backend, model_name, scores_path],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        if process.returncode != 0:
+            error = (process.stderr.strip().splitlines() or ["failed"])[-1]
+            if baseline_scores is None:
+                # Tanpa baseline torch, drift backend lain tidak ada artinya
+                sys.exit(f"baseline {backend}:{model_name} failed, cannot measure drift: {error}")
+            print(f"{backend}:{model_name} skipped: {error}")
+            continue
+        result = json.loads(process.stdout.strip().splitlines()[-1])
+        scores = np.load(scores_path)
+        if baseline_scores is None:
+            baseline_scores = scores
+        result["drift"] = drift(baseline_scores, scores)
+        results.append(result)
+
+    print(f"{'backend':<12}{'model':<42}{'load s':>8}{'p50 ms':>9}{'res/s':>8}{'RSS MB':>9}"
+          f"{'|Δ| mean':>10}{'|Δ| max':>9}{'rho':>7}{'top10':>7}")
+    for result in results:
+        d = result["drift"]
+        rss = f"{result['peak_rss_mb']:.0f}" if result["peak_rss_mb"] else "-"
+        print(f"{result['backend']:<12}{result['model'].split('/')[-1]:<42}{result['load_s']:>8.1f}"
+              f"{result['single_p50_ms']:>9.1f}{result['batch_resumes_per_s']:>8.1f}{rss:>9}"
+              f"{d['mean_abs_diff']:>10.4f}{d['max_abs_diff']:>9.4f}{d['spearman']:>7.3f}{d['top10_overlap']:>7.2f}")
+
+    output = args.output or os.path.join(
+        ROOT, "benchmarks", "results", f"backends-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"samples": args.samples, "results": results}, f, indent=2)
+    print(f"saved {output}")
@@ -0,0 +1,135 @@
+# bulk_intake.py
+import streamlit as st
+import hashlib
+import sys
+import os
+import time
+
+st.set_page_config(page_title="Bulk Resume Intake", layout="wide")
+
+# ===== Custom CSS =====
+st.markdown("""
+<style>
+/* Background gradient */
+.stApp {
+    background: linear-gradient(135deg, #4f00bc, #29abe2);
+    color: white;
+}
+
+/* Headings */
+h1, h2, h3, h4 {
+    color: white;
+}
+</style>
+""", unsafe_allow_html=True)
+
+# ===== Cek login =====
+if "logged_in" not in st.session_state or not st.session_state.logged_in or "username" not in st.session_state:
+    st.warning("⚠️ Silakan login terlebih dahulu.")
+    st.stop()
+
+# ===== Import jobs (tanpa set_page_config) =====
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from scandidai.bulk import (
+    FINISHED_STATUSES, BulkIntakeError, collect_pdfs, export_csv, ranked_results, screen_documents,
+)
+from scandidai.config import ADMIN_USERS, BULK_MAX_FILES
+from scandidai.jobs import all_jobs
+
+# Hanya recruiter (admin) yang boleh screening massal
+if st.session_state.username not in ADMIN_USERS:
+    st.warning("⚠️ Bulk intake is only available to recruiters.")
+    st.stop()
+
+st.title("📦 Bulk Resume Intake")
+st.caption(f"Upload up to {BULK_MAX_FILES} resumes (PDF files or ZIP archives of PDFs) and rank them for one job.")
+
+jobs = all_jobs()
+selected = st.selectbox("Job", range(len(jobs)), format_func=lambda i: jobs[i].label)
+job = jobs[selected]
+uploads = st.file_uploader("Resumes", type=["pdf", "zip"], accept_multiple_files=True)
+
+DISPLAY_COLUMNS = [
+    "rank", "file", "status", "ats_score", "skill_coverage", "ai_score", "final_score",
+    "matched_skills", "missing_skills", "error",
+]
+
+def results_frame(rows):
+    import pandas as pd
+
+    df = pd.DataFrame(ranked_results(rows), columns=DISPLAY_COLUMNS)
+    return df.astype({"rank": "Int64"})
+
+# ===== Screening =====
+# Hasil disimpan di session_state per (job, file) supaya rerun (klik
+# download, ganti tab) tidak menjalankan screening ulang.
+files = [(upload.name, upload.getvalue()) for upload in uploads or []]
+digest = hashlib.sha256()
+digest.update(job.id.encode("utf-8"))
+for name, data in files:
+    digest.update(name.encode("utf-8"))
+    digest.update(hashlib.sha256(data).digest())
+run_key = digest.hexdigest()
+bulk_run = st.session_state.get("bulk_run")
+
+if st.button("🚀 Start screening", disabled=not files):
+    try:
+        documents = collect_pdfs(files)
+    except BulkIntakeError as e:
+        st.error(str(e))
+        st.stop()
+    if not documents:
+        st.error("No PDF files found in the upload.")
+        st.stop()
+
+    progress = st.progress(0.0, text="Parsing resumes...")
+    counters = st.empty()
+    table = st.empty()
+    rows = {}
+    finished = failed = rejected = 0
+    last_render = 0.0
+    for row in screen_documents(documents, job.description, job.skills, job.cascade, job.id):
+        rows[row["id"]] = row
+        if row["status"] in FINISHED_STATUSES:
+            finished += 1
+            failed += row["status"] == "failed"
+            rejected += row["status"] == "fast_rejected"
+        # Render dibatasi supaya ratusan update tidak membebani browser
+        now = time.monotonic()
+        if now - last_render >= 0.5 or finished == len(documents):
+            last_render = now
+            progress.progress(finished / len(documents), text=f"Screened {finished}/{len(documents)} resumes")
+            counters.caption(
+                f"✅ {finished - failed - rejected} evaluated · ⏭️ {rejected} fast-rejected · "
+                f"❌ {failed} failed · ⏳ {len(documents) - finished} in progress"
+            )
+            table.dataframe(results_frame(list(rows.values())), hide_index=True, use_container_width=True)
+    progress.empty()
+    counters.empty()
+    table.empty()
+    bulk_run = st.session_state.bulk_run = {"key": run_key, "job": job.id, "rows": list(rows.values())}
+
+# ===== Hasil =====
+if bulk_run and bulk_run["key"] == run_key:
+    rows = bulk_run["rows"]
+    done = sum(row["status"] == "done" for row in rows)
+    rejected = sum(row["status"] == "fast_rejected" for row in rows)
+    st.subheader(f"Ranking for {job.label}")
+    st.caption(f"{done} of {len(rows)} resumes evaluated by AI, {rejected} fast-rejected without an LLM call")
+    st.dataframe(results_frame(rows), hide_index=True, use_container_width=True)
+
+    st.download_button(
+        label="📥 Download Ranked Results",
+        data=export_csv(rows).encode('utf-8'),
+        file_name=f"bulk_{job.id}_ranked.csv",
+        mime="text/csv"
+    )
+
+    with st.expander("📄 Open a candidate report"):
+        screened = [row for row in ranked_results(rows) if row["status"] == "done"]
+        if screened:
+            choice = st.selectbox(
+                "Candidate", range(len(screened)),
+                format_func=lambda i: f"#{screened[i]['rank']} {screened[i]['file']} ({screened[i]['final_score']:.2f})",
+            )
+            st.markdown(screened[choice]["report"])
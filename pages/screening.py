@@ -0,0 +1,277 @@
+# screening.py
+# Satu halaman screening untuk semua job di scandidai/job_data.py; job dipilih
+# lewat query param (?job=data-engineer).
+import streamlit as st
+import sys
+import os
+
+# ===== Set page config =====
+st.set_page_config(page_title="scandidAI Screening", layout="wide")
+
+# ===== Custom CSS Styling =====
+st.markdown("""
+<style>
+/* Background gradient */
+.stApp {
+    background: linear-gradient(135deg, #4f00bc, #29abe2);
+    color: white;
+}
+
+/* Form Card */
+.form-card {
+    background-color: rgba(0,0,0,0.6);
+    padding: 20px;
+    border-radius: 12px;
+    margin-bottom: 20px;
+}
+
+/* Text area styling */
+textarea {
+    background-color: rgba(255,255,255,0.1);
+    color: white;
+    border-radius: 8px;
+}
+
+/* Score cards */
+.score-card {
+    background: rgba(255,255,255,0.1);
+    padding: 15px;
+    border-radius: 10px;
+    text-align: center;
+}
+
+/* AI Report Box */
+.report-box {
+    background-color: rgba(0,0,0,0.8);
+    color: #ffffff;
+    padding: 15px;
+    border-radius: 10px;
+    max-height: 400px;
+    overflow-y: auto;
+    font-family: monospace;
+}
+
+/* Download button */
+.stButton>button {
+    background: linear-gradient(to right, #00c6ff, #0072ff);
+    color: white;
+    font-weight: bold;
+    border-radius: 10px;
+}
+.stButton>button:hover {
+    background: linear-gradient(to right, #0072ff, #00c6ff);
+}
+</style>
+""", unsafe_allow_html=True)
+
+# ===== Cek login =====
+if "logged_in" not in st.session_state or not st.session_state.logged_in or "username" not in st.session_state:
+    st.warning("⚠️ Silakan login terlebih dahulu.")
+    st.stop()
+
+username = st.session_state.username
+st.title(f"👋 Hi, {username}")
+
+# ===== Import jobs (tanpa set_page_config) =====
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from scandidai.config import ADMIN_USERS, QUEUE_POLL_INTERVAL
+from scandidai.jobs import UnknownJobError, all_jobs, get_job
+from scandidai.metrics import start_metrics_server
+from scandidai.report_store import load_report
+from scandidai.screening_queue import (
+    ACTIVE_STATUSES, active_task, enqueue, estimated_wait, get_task, live_workers, queue_position,
+)
+from scandidai.worker import ensure_embedded_workers
+
+# ===== Pilih job =====
+job_id = st.query_params.get("job")
+try:
+    job = get_job(job_id)
+except UnknownJobError:
+    if job_id:
+        st.error(f"Job '{job_id}' not found in job_data.py")
+    profiles = all_jobs()
+    choice = st.selectbox("Choose a role", range(len(profiles)), format_func=lambda i: profiles[i].label)
+    if st.button("Apply"):
+        st.query_params["job"] = profiles[choice].id
+        st.rerun()
+    st.stop()
+
+job_desc = job.description
+
+start_metrics_server()
+ensure_embedded_workers()
+job.import_legacy_results()
+
+# ===== Session State =====
+# Disimpan per job, jadi berpindah role tidak mencampur submission.
+# Setelah refresh/login ulang, lanjutkan submission yang masih diproses.
+screening_state = st.session_state.setdefault("screening", {})
+if job.id not in screening_state:
+    task_id = active_task(username, job.id)
+    screening_state[job.id] = {"task_id": task_id, "form_submitted": task_id is not None}
+state = screening_state[job.id]
+
+st.title(f"scandidAI – {job.title} Role Screening")
+
+# ===== Functions =====
+def show_score_card(placeholder, label, value):
+    with placeholder.container():
+        st.markdown('<div class="score-card">', unsafe_allow_html=True)
+        st.write(label)
+        if value is None:
+            st.subheader("...")
+        else:
+            st.subheader(f"{value:.4f}")
+        st.markdown('</div>', unsafe_allow_html=True)
+
+def show_skills_card(placeholder, skills):
+    # Hasil prefilter skill (scandidai.skills), di samping ATS score
+    with placeholder.container():
+        st.markdown('<div class="score-card">', unsafe_allow_html=True)
+        st.write("Skill Coverage:")
+        if not skills:
+            st.subheader("...")
+        else:
+            st.subheader(f"{skills['coverage']:.0%}")
+            st.caption(f"✅ Matched: {', '.join(skills['matched']) or '-'}")
+            st.caption(f"❌ Missing: {', '.join(skills['missing']) or '-'}")
+        st.markdown('</div>', unsafe_allow_html=True)
+
+def show_report_box(placeholder, report):
+    placeholder.markdown(f'<div class="report-box">{report}</div>', unsafe_allow_html=True)
+
+@st.fragment(run_every=QUEUE_POLL_INTERVAL)
+def show_task_progress(task_id):
+    # Poll status task; begitu selesai/gagal, seluruh halaman di-rerun
+    task = get_task(task_id)
+    if task is None or task["status"] not in ACTIVE_STATUSES:
+        st.rerun()
+
+    if task["status"] == "queued":
+        wait = estimated_wait(task)
+        eta = f", about {max(1, round(wait / 60))} min" if wait is not None else ""
+        st.info(f"⏳ Your submission is in the queue (position #{queue_position(task)}{eta})...")
+        if not live_workers():
+            st.warning("No screening worker is running right now. Your submission will be processed as soon as one starts.")
+    else:
+        st.info("Calculating similarity score and generating AI evaluation report...")
+
+    col1, col2, col3 = st.columns(3)
+    show_score_card(col1.empty(), "ATS Similarity Score:", task["ats_score"])
+    show_skills_card(col2.empty(), task["skills"])
+    show_score_card(col3.empty(), "Average AI Score:", task["avg_score"] if task["report"] else None)
+
+    st.subheader("AI Generated Analysis Report")
+    show_report_box(st.empty(), task["report"] or "")
+
+# ===== Form =====
+if not state["form_submitted"]:
+    st.markdown('<div class="form-card">', unsafe_allow_html=True)
+    with st.form("application_form"):
+        resume_file = st.file_uploader("Upload your Resume/CV (PDF)", type="pdf")
+        open_question = st.text_area(
+            "Tell us why you are matching with this role (max 500 words):",
+            max_chars=3000,
+            placeholder="Write your answer here..."
+        )
+
+        submitted = st.form_submit_button("Submit Application")
+        if submitted:
+            if resume_file and open_question.strip():
+                # Diproses worker antrean; halaman hanya menunggu hasilnya
+                state["task_id"] = enqueue(
+                    job.id, username, job_desc, resume_file.getvalue(), open_question
+                )
+                state["form_submitted"] = True
+                st.rerun()
+            else:
+                st.warning("Please upload your CV and fill the open question.")
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# ===== Processing =====
+if state["form_submitted"]:
+    task = get_task(state["task_id"]) if state["task_id"] else None
+    if task is None:
+        state["form_submitted"] = False
+        state["task_id"] = None
+        st.rerun()
+
+    if task["status"] in ACTIVE_STATUSES:
+        show_task_progress(task["id"])
+        st.stop()
+
+    if task["status"] == "failed":
+        st.error(f"Screening failed: {task['error']}")
+        if st.button("Submit again"):
+            state["form_submitted"] = False
+            state["task_id"] = None
+            st.rerun()
+        st.stop()
+
+    # Modul berat (pandas) baru di-import di sini, jadi form bisa tampil
+    # tanpa menunggu import-nya.
+    import pandas as pd
+
+    if task["status"] == "fast_rejected":
+        # Ditolak cascade dari ATS score + skill, tanpa report LLM
+        st.warning(
+            "Your resume does not match this role closely enough to continue to the AI evaluation. "
+            "Check the missing skills below and consider applying to a role that fits your profile better."
+        )
+        col1, col2 = st.columns(2)
+        show_score_card(col1.empty(), "ATS Similarity Score:", task["ats_score"])
+        show_skills_card(col2.empty(), task["skills"])
+    else:
+        st.success("Analysis complete!")
+        col1, col2, col3 = st.columns(3)
+        show_score_card(col1.empty(), "ATS Similarity Score:", task["ats_score"])
+        show_skills_card(col2.empty(), task["skills"])
+        show_score_card(col3.empty(), "Average AI Score:", task["avg_score"])
+
+        st.subheader("AI Generated Analysis Report")
+        show_report_box(st.empty(), task["report"])
+
+        report = task["report"]
+
+        st.download_button(
+            label="Download Report",
+            data=report,
+            file_name=f"{job.id.replace('-', '_')}_report.txt",
+            icon=":material/download:",
+        )
+
+    # Hasil sudah disimpan worker ke results store dan index kandidat
+    st.success("Data telah disimpan")
+
+    leaderboard = job.leaderboard
+    st.info(f"Your position: #{leaderboard.rank(task['final_score'])} of {len(leaderboard)} candidates")
+
+    st.subheader("🏆 Top 10 Candidates")
+    top_entries = leaderboard.top()
+    top_10 = pd.DataFrame(
+        top_entries,
+        columns=['rank', 'username', 'final_score', 'bert_score', 'groq_score', 'status', 'timestamp']
+    )
+    st.dataframe(
+        top_10,
+        hide_index=True,
+        use_container_width=True
+    )
+
+    st.download_button(
+        label="📥 Download Top 10 Results",
+        data=top_10.to_csv(index=False).encode('utf-8'),
+        file_name=f"top_10_scores_{job.id}.csv",
+        mime="text/csv"
+    )
+
+    # Report kandidat dibaca dari report store hanya saat dibuka
+    if username in ADMIN_USERS and top_entries:
+        with st.expander("📄 Open a candidate report"):
+            choice = st.selectbox(
+                "Candidate",
+                range(len(top_entries)),
+                format_func=lambda i: f"#{top_entries[i]['rank']} {top_entries[i]['username']} ({top_entries[i]['final_score']:.2f})",
+            )
+            show_report_box(st.empty(), load_report(top_entries[choice]["report_hash"]) or "Report not available.")
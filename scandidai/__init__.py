@@ -0,0 +1,2 @@
+# scandidai/__init__.py
+# Shared helpers for the ScandidAI screening pages (model, scoring, storage).
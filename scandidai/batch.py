@@ -0,0 +1,157 @@
+# batch.py
+# Screening offline: skor semua resume di dataset terhadap semua job di
+# scandidai/job_data.py, tanpa lewat UI.
+#
+#   python -m scandidai.batch
+#
+# Default input = dataset hasil `python -m scandidai.dataset build` (dibangun
+# otomatis kalau belum ada/kadaluarsa); --input juga menerima CSV.
+#
+# Output: satu file ranking per job di --output-dir. Setiap chunk yang
+# selesai disimpan sebagai checkpoint, jadi run yang terputus bisa
+# dilanjutkan dengan perintah yang sama.
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+from scandidai.config import DATASET_PATH
+from scandidai.dataset import ensure_dataset, iter_dataset
+from scandidai.model import ATS_MODEL_KEY
+
+TEXT_COLUMN = "Resume Text"
+ID_COLUMNS = ["Resume_ID", "Name", "Job Role", "Job Category"]
+PROFILE_COLUMNS = ["Job Role", "Skills", "Experience (Years)", "Education", "Certifications"]
+
+def resume_text_from_row(row):
+    # Baris dari AI_Resume_Screening.csv tidak punya "Resume Text";
+    # teksnya disusun dari kolom profil.
+    text = row.get(TEXT_COLUMN)
+    if isinstance(text, str) and text.strip():
+        return text
+    parts = []
+    for column in PROFILE_COLUMNS:
+        value = row.get(column)
+        if pd.notna(value) and str(value).strip():
+            parts.append(f"{column}: {value}")
+    return "\n".join(parts)
+
+# ===== Checkpoint =====
+def _manifest(args, jobs):
+    stat = os.stat(args.input)
+    return {
+        "input": os.path.abspath(args.input),
+        "input_size": stat.st_size,
+        "input_mtime": stat.st_mtime,
+        "chunk_size": args.chunk_size,
+        # Skor chunk bergantung pada model/backend embedding dan isi deskripsi
+        "model": ATS_MODEL_KEY,
+        "jobs": [job.id for job in jobs],
+        "descriptions": [hashlib.sha256(job.description.encode("utf-8")).hexdigest() for job in jobs],
+        "skills": [job.skills for job in jobs],
+    }
+
+def _prepare_checkpoint_dir(args, jobs):
+    checkpoint_dir = os.path.join(args.output_dir, ".chunks")
+    manifest_path = os.path.join(checkpoint_dir, "manifest.json")
+    manifest = _manifest(args, jobs)
+
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            previous = json.load(f)
+        if previous != manifest or args.restart:
+            # Input atau pengaturan berubah: checkpoint lama tidak valid
+            for path in glob.glob(os.path.join(checkpoint_dir, "chunk_*.csv")):
+                os.remove(path)
+
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    return checkpoint_dir
+
+def _chunk_path(checkpoint_dir, index):
+    return os.path.join(checkpoint_dir, f"chunk_{index:06d}.csv")
+
+# ===== Batch run =====
+def run_batch(args):
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from scandidai.jobs import all_jobs
+    from scandidai.scoring import calculate_similarity_bert_batch
+    from scandidai.skills import skill_coverage_batch
+
+    if args.threads:
+        import torch
+        torch.set_num_threads(args.threads)
+
+    if args.input == DATASET_PATH:
+        ensure_dataset(args.input)
+    jobs = all_jobs()
+    slugs = [job.id for job in jobs]
+    job_descs = [job.description for job in jobs]
+    checkpoint_dir = _prepare_checkpoint_dir(args, jobs)
+
+    processed = 0
+    started = time.perf_counter()
+    for index, chunk in enumerate(iter_dataset(args.input, args.chunk_size)):
+        path = _chunk_path(checkpoint_dir, index)
+        if os.path.exists(path):
+            continue
+
+        chunk_started = time.perf_counter()
+        texts = [resume_text_from_row(row) for row in chunk.to_dict("records")]
+        scores = calculate_similarity_bert_batch(texts, job_descs, batch_size=args.batch_size)
+        coverage = skill_coverage_batch(texts, [job.skills for job in jobs])
+
+        result = pd.DataFrame({"row": chunk.index})
+        for column in ID_COLUMNS:
+            if column in chunk.columns:
+                result[column] = chunk[column].to_numpy()
+        for j, slug in enumerate(slugs):
+            result[slug] = scores[:, j]
+            result[f"{slug}_skills"] = coverage[:, j]
+
+        tmp_path = f"{path}.tmp"
+        result.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+        processed += len(chunk)
+        elapsed = time.perf_counter() - chunk_started
+        print(f"chunk {index}: {len(chunk)} resumes in {elapsed:.1f}s ({len(chunk) / elapsed:.1f} resumes/s)")
+
+    total_elapsed = time.perf_counter() - started
+    if processed:
+        print(f"Scored {processed} resumes in {total_elapsed:.1f}s ({processed / total_elapsed:.1f} resumes/s)")
+    else:
+        print("All chunks already scored, rebuilding rankings from checkpoint")
+
+    # ===== Ranking per job =====
+    chunk_files = sorted(glob.glob(os.path.join(checkpoint_dir, "chunk_*.csv")))
+    all_scores = pd.concat((pd.read_csv(path) for path in chunk_files), ignore_index=True)
+    id_columns = [column for column in ["row"] + ID_COLUMNS if column in all_scores.columns]
+    for slug in slugs:
+        ranked = all_scores[id_columns + [slug, f"{slug}_skills"]].rename(
+            columns={slug: "bert_score", f"{slug}_skills": "skill_coverage"}
+        )
+        ranked = ranked.sort_values("bert_score", ascending=False, kind="stable")
+        ranked.insert(0, "rank", ranked["bert_score"].rank(ascending=False, method="min").astype(int))
+        output_path = os.path.join(args.output_dir, f"{slug}.csv")
+        ranked.to_csv(output_path, index=False)
+        print(f"{slug}: {len(ranked)} ranked resumes -> {output_path}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Batch ATS screening over a resume dataset")
+    parser.add_argument("--input", default=DATASET_PATH, help="Parquet dataset or CSV")
+    parser.add_argument("--output-dir", default="batch_results")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="rows read from the input at a time")
+    parser.add_argument("--batch-size", type=int, default=64, help="resumes per encode batch")
+    parser.add_argument("--threads", type=int, default=os.cpu_count(), help="torch CPU threads")
+    parser.add_argument("--restart", action="store_true", help="ignore existing checkpoints")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    run_batch(parse_args())
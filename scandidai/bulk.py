@@ -0,0 +1,235 @@
+# bulk.py
+# Screening banyak resume sekaligus untuk recruiter (ZIP / banyak PDF untuk
+# satu job), dipakai halaman pages/bulk_intake.py dan CLI:
+#
+#   python -m scandidai.bulk data-engineer resumes.zip more.pdf --output ranked.csv
+#
+# Pipeline berjalan bertahap dan tumpang tindih: PDF diparse paralel di
+# process pool, teks yang sudah siap di-encode per batch, lalu report Groq
+# dijalankan paralel (dibatasi scheduler Groq) sementara parsing/encoding
+# berikutnya jalan. Resume yang ditolak cascade (scandidai.cascade) tidak
+# dikirim ke Groq. Setiap perubahan status satu resume di-yield supaya
+# progres dan hasil parsial bisa ditampilkan.
+import argparse
+import io
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from scandidai.config import BULK_EMBED_BATCH, BULK_MAX_FILES, LLM_MAX_IN_FLIGHT, PDF_MAX_BYTES, PDF_WORKERS
+from scandidai.metrics import increment, observe
+
+FINISHED_STATUSES = ("done", "fast_rejected", "failed")
+RANKED_STATUSES = ("done", "fast_rejected")
+
+EXPORT_COLUMNS = [
+    "rank", "file", "status", "ats_score", "skill_coverage", "ai_score", "final_score",
+    "matched_skills", "missing_skills", "error", "report",
+]
+
+class BulkIntakeError(Exception):
+    pass
+
+# ===== Input =====
+def collect_pdfs(files, max_files=BULK_MAX_FILES):
+    # files: list (nama, bytes); ZIP dibuka dan semua PDF di dalamnya diambil
+    documents = []
+    for name, data in files:
+        if name.lower().endswith(".zip"):
+            try:
+                archive = zipfile.ZipFile(io.BytesIO(data))
+            except zipfile.BadZipFile:
+                raise BulkIntakeError(f"{name} is not a valid ZIP file")
+            with archive:
+                for info in archive.infolist():
+                    base = os.path.basename(info.filename)
+                    if info.is_dir() or not base.lower().endswith(".pdf") or base.startswith("._"):
+                        continue
+                    # Cek ukuran sebelum dibaca (ZIP bomb)
+                    if info.file_size > PDF_MAX_BYTES:
+                        documents.append((f"{name}/{info.filename}", None))
+                        continue
+                    documents.append((f"{name}/{info.filename}", archive.read(info)))
+        elif name.lower().endswith(".pdf"):
+            documents.append((name, data))
+        if len(documents) > max_files:
+            raise BulkIntakeError(f"At most {max_files} resumes can be screened at once")
+    return documents
+
+# ===== Pipeline =====
+def screen_documents(
+    documents, job_desc, required_skills=None, cascade=None, job_id="bulk",
+    batch_size=BULK_EMBED_BATCH, llm_workers=LLM_MAX_IN_FLIGHT,
+):
+    from scandidai.cascade import CascadePolicy, fast_reject_score, record_avoided_call
+    from scandidai.pdf_extract import PdfExtractionError, extract_pdf_bytes
+    from scandidai.report import average_score, build_prompt, extract_scores, get_report
+    from scandidai.scoring import calculate_similarity_bert_batch
+    from scandidai.skills import job_skills, skill_coverage
+
+    if required_skills is None:
+        required_skills = job_skills(job_desc)
+    if cascade is None:
+        cascade = CascadePolicy()
+
+    rows = [
+        {"id": i, "file": name, "status": "parsing", "ats_score": None, "skill_coverage": None,
+         "ai_score": None, "final_score": None, "matched_skills": None, "missing_skills": None,
+         "error": None, "report": None}
+        for i, (name, _) in enumerate(documents)
+    ]
+    texts = {}
+    ready = []
+    avoided = 0
+    started = time.perf_counter()
+
+    def failed(row, error):
+        row.update(status="failed", error=error)
+        increment("bulk_failed")
+        return row
+
+    parse_pool = ThreadPoolExecutor(max_workers=PDF_WORKERS, thread_name_prefix="bulk-parse")
+    llm_pool = ThreadPoolExecutor(max_workers=llm_workers, thread_name_prefix="bulk-llm")
+    try:
+        parse_futures = {}
+        for row, (_, data) in zip(rows, documents):
+            if data is None:
+                yield failed(row, f"PDF is larger than {PDF_MAX_BYTES // (1024 * 1024)} MB")
+            else:
+                parse_futures[parse_pool.submit(extract_pdf_bytes, data)] = row
+        llm_futures = {}
+
+        while parse_futures or llm_futures or ready:
+            # Encode per batch: tunggu batch penuh, kecuali parsing sudah habis
+            if ready and (len(ready) >= batch_size or not parse_futures):
+                batch, ready = ready[:batch_size], ready[batch_size:]
+                scores = calculate_similarity_bert_batch([texts[row["id"]] for row in batch], [job_desc], batch_size)
+                for row, score in zip(batch, scores[:, 0]):
+                    ats_score = float(score)
+                    text = texts[row["id"]]
+                    if not cascade.needs_llm(ats_score, row["skill_coverage"]):
+                        record_avoided_call(
+                            job_id, len(build_prompt(text, job_desc)), ats_score, row["skill_coverage"], log=False
+                        )
+                        row.update(
+                            status="fast_rejected", ats_score=ats_score, final_score=fast_reject_score(ats_score)
+                        )
+                        texts.pop(row["id"])
+                        avoided += 1
+                        yield row
+                        continue
+                    row.update(status="evaluating", ats_score=ats_score)
+                    llm_futures[llm_pool.submit(get_report, text, job_desc)] = row
+                    yield row
+                continue
+
+            done, _ = wait(list(parse_futures) + list(llm_futures), return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in parse_futures:
+                    row = parse_futures.pop(future)
+                    try:
+                        text = future.result()
+                    except PdfExtractionError as e:
+                        yield failed(row, f"Error extracting text from PDF: {e}")
+                        continue
+                    except Exception as e:
+                        # Error tak terduga hanya menggagalkan file ini
+                        yield failed(row, f"Error reading PDF: {e}")
+                        continue
+                    if not text.strip():
+                        yield failed(row, "No text found in PDF")
+                        continue
+                    texts[row["id"]] = text
+                    skills = skill_coverage(text, required_skills)
+                    row.update(
+                        status="embedding",
+                        skill_coverage=skills["coverage"],
+                        matched_skills=", ".join(skills["matched"]),
+                        missing_skills=", ".join(skills["missing"]),
+                    )
+                    ready.append(row)
+                    yield row
+                else:
+                    row = llm_futures.pop(future)
+                    try:
+                        report = future.result()
+                    except Exception as e:
+                        yield failed(row, f"AI evaluation failed: {e}")
+                        continue
+                    ai_score = average_score(extract_scores(report))
+                    row.update(
+                        status="done",
+                        report=report,
+                        ai_score=ai_score,
+                        final_score=round((row["ats_score"] + ai_score) / 2, 2),
+                    )
+                    texts.pop(row["id"], None)
+                    increment("bulk_screened")
+                    yield row
+    finally:
+        # Run ditinggalkan (rerun/navigasi Streamlit menutup generator):
+        # jangan tunggu parsing dan panggilan LLM yang masih antre
+        parse_pool.shutdown(wait=False, cancel_futures=True)
+        llm_pool.shutdown(wait=False, cancel_futures=True)
+
+    observe("bulk_screening", time.perf_counter() - started)
+    if avoided:
+        print(f"[cascade] {job_id}: fast-rejected {avoided} of {len(rows)} resumes (LLM calls skipped)", file=sys.stderr)
+
+# ===== Export =====
+def ranked_results(rows):
+    # Urut final_score (rank seperti method='min'); yang gagal di bawah
+    done = sorted((row for row in rows if row["status"] in RANKED_STATUSES), key=lambda row: -row["final_score"])
+    ranked = []
+    for position, row in enumerate(done, start=1):
+        rank = ranked[-1]["rank"] if ranked and ranked[-1]["final_score"] == row["final_score"] else position
+        ranked.append(dict(row, rank=rank))
+    ranked.extend(dict(row, rank=None) for row in rows if row["status"] not in RANKED_STATUSES)
+    return ranked
+
+def export_csv(rows):
+    import csv
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(ranked_results(rows))
+    return buffer.getvalue()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Screen many resumes for one job")
+    parser.add_argument("job", help="job id or title from scandidai/job_data.py")
+    parser.add_argument("paths", nargs="+", help="PDF or ZIP files")
+    parser.add_argument("--output", default="bulk_results.csv")
+    parser.add_argument("--batch-size", type=int, default=BULK_EMBED_BATCH)
+    args = parser.parse_args()
+
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from scandidai.jobs import UnknownJobError, find_job
+
+    try:
+        job = find_job(args.job)
+    except UnknownJobError:
+        sys.exit(f"Unknown job: {args.job}")
+
+    files = []
+    for path in args.paths:
+        with open(path, "rb") as f:
+            files.append((os.path.basename(path), f.read()))
+    documents = collect_pdfs(files)
+
+    rows = {}
+    finished = 0
+    screening = screen_documents(
+        documents, job.description, job.skills, job.cascade, job.id, batch_size=args.batch_size
+    )
+    for row in screening:
+        rows[row["id"]] = row
+        if row["status"] in FINISHED_STATUSES:
+            finished += 1
+            print(f"[{finished}/{len(documents)}] {row['file']}: {row['status']} {row['final_score'] or row['error']}")
+    with open(args.output, "w", newline="", encoding="utf-8") as f:
+        f.write(export_csv(list(rows.values())))
+    print(f"Ranked results -> {args.output}")
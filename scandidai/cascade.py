@@ -0,0 +1,63 @@
+# cascade.py
+# Cascade scoring per job: skor murah (ATS similarity BERT + coverage
+# skill) dihitung dulu, report Groq (model 70B) hanya diminta kalau
+# kandidat lolos. Kandidat yang jelas tidak cocok disimpan dengan status
+# "fast_rejected" tanpa panggilan LLM.
+#
+#   ATS >= min_ats                              -> LLM
+#   min_ats - band <= ATS < min_ats (ragu-ragu) -> LLM kalau coverage skill
+#                                                  >= min_skill_coverage
+#   selain itu                                  -> fast_rejected
+#
+# Default dari config (SCANDIDAI_CASCADE_*), bisa di-override per job lewat
+# field "cascade" di scandidai/job_data.py.
+import sys
+
+from scandidai.config import (
+    CASCADE_BAND,
+    CASCADE_ENABLED,
+    CASCADE_MIN_ATS,
+    CASCADE_MIN_SKILL_COVERAGE,
+    LLM_EXPECTED_OUTPUT_TOKENS,
+)
+from scandidai.metrics import increment
+
+EVALUATED = "evaluated"
+FAST_REJECTED = "fast_rejected"
+
+class CascadePolicy:
+    def __init__(self, enabled=CASCADE_ENABLED, min_ats=CASCADE_MIN_ATS, band=CASCADE_BAND,
+                 min_skill_coverage=CASCADE_MIN_SKILL_COVERAGE):
+        self.enabled = enabled
+        self.min_ats = min_ats
+        self.band = band
+        self.min_skill_coverage = min_skill_coverage
+
+    @classmethod
+    def for_job(cls, job):
+        # job: entry dari job_data.py (dict)
+        return cls(**job.get("cascade", {}))
+
+    def needs_llm(self, ats_score, skill_coverage):
+        if not self.enabled or ats_score >= self.min_ats:
+            return True
+        # Band ketidakpastian: bukti leksikal yang menentukan
+        return ats_score >= self.min_ats - self.band and skill_coverage >= self.min_skill_coverage
+
+def fast_reject_score(ats_score):
+    # Sama dengan rumus final score biasa dengan AI score 0, jadi kandidat
+    # fast-rejected tetap bisa diurutkan bersama kandidat lain
+    return round(ats_score / 2, 2)
+
+def record_avoided_call(job, prompt_chars, ats_score, skill_coverage, log=True):
+    # Perkiraan token ~4 karakter per token (input) + output yang biasa diminta
+    tokens = prompt_chars // 4 + LLM_EXPECTED_OUTPUT_TOKENS
+    increment("llm_calls_avoided")
+    increment("llm_tokens_avoided", tokens)
+    if log:
+        print(
+            f"[cascade] {job}: fast-rejected (ATS {ats_score:.3f}, skills {skill_coverage:.0%}), "
+            f"skipped 1 LLM call (~{tokens} tokens)",
+            file=sys.stderr,
+        )
+    return tokens
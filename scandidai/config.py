@@ -0,0 +1,91 @@
+# config.py
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# ===== Paths =====
+# Semua artefak yang bisa dibangun ulang (embedding, cache) disimpan di sini.
+CACHE_DIR = os.getenv("SCANDIDAI_CACHE_DIR", ".scandidai_cache")
+JOB_EMBEDDING_DIR = os.path.join(CACHE_DIR, "job_embeddings")
+
+# Dataset resume gabungan (python -m scandidai.dataset build)
+DATASET_PATH = os.getenv("SCANDIDAI_DATASET", os.path.join(CACHE_DIR, "resume_dataset.parquet"))
+
+# ===== Groq =====
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+# Kosong = api.groq.com; isi dengan URL scandidai.mock_groq untuk load test
+GROQ_BASE_URL = os.getenv("GROQ_BASE_URL") or None
+GROQ_MODEL = "llama-3.3-70b-versatile"
+
+# ===== Results store =====
+RESULTS_DB = os.getenv("SCANDIDAI_RESULTS_DB", "screening_results.db")
+# Teks report LLM (gzip, nama file = SHA-256 isi report)
+REPORT_STORE_DIR = os.getenv("SCANDIDAI_REPORT_STORE_DIR", "screening_reports")
+
+# ===== Screening queue =====
+# Submission masuk antrean SQLite dan diproses worker (python -m scandidai.worker).
+# QUEUE_EMBEDDED_WORKERS > 0: proses Streamlit ikut menjalankan worker thread,
+# jadi `streamlit run app.py` saja sudah cukup; isi 0 kalau worker dijalankan
+# terpisah.
+QUEUE_DB = os.getenv("SCANDIDAI_QUEUE_DB", "screening_queue.db")
+QUEUE_EMBEDDED_WORKERS = int(os.getenv("SCANDIDAI_QUEUE_EMBEDDED_WORKERS", "1"))
+QUEUE_LEASE = float(os.getenv("SCANDIDAI_QUEUE_LEASE", "120"))
+QUEUE_MAX_ATTEMPTS = int(os.getenv("SCANDIDAI_QUEUE_MAX_ATTEMPTS", "3"))
+QUEUE_POLL_INTERVAL = float(os.getenv("SCANDIDAI_QUEUE_POLL_INTERVAL", "1.0"))
+
+# ===== Scoring cascade =====
+# Report Groq hanya diminta kalau ATS score >= MIN_ATS, atau berada di band
+# [MIN_ATS - BAND, MIN_ATS) dengan coverage skill >= MIN_SKILL_COVERAGE;
+# sisanya disimpan sebagai "fast_rejected". Override per job lewat field
+# "cascade" di scandidai/job_data.py; SCANDIDAI_CASCADE=0 mematikan cascade.
+CASCADE_ENABLED = os.getenv("SCANDIDAI_CASCADE", "1") != "0"
+CASCADE_MIN_ATS = float(os.getenv("SCANDIDAI_CASCADE_MIN_ATS", "0.30"))
+CASCADE_BAND = float(os.getenv("SCANDIDAI_CASCADE_BAND", "0.10"))
+CASCADE_MIN_SKILL_COVERAGE = float(os.getenv("SCANDIDAI_CASCADE_MIN_SKILL_COVERAGE", "0.25"))
+
+# ===== Bulk intake =====
+# Batas jumlah resume per upload recruiter dan ukuran batch encode BERT
+BULK_MAX_FILES = int(os.getenv("SCANDIDAI_BULK_MAX_FILES", "500"))
+BULK_EMBED_BATCH = int(os.getenv("SCANDIDAI_BULK_EMBED_BATCH", "32"))
+
+# ===== Resume vector index =====
+RESUME_INDEX_DIR = os.getenv("SCANDIDAI_RESUME_INDEX_DIR", os.path.join(CACHE_DIR, "resume_index"))
+RESUME_INDEX_DTYPE = os.getenv("SCANDIDAI_RESUME_INDEX_DTYPE", "float32")
+
+# ===== PDF extraction =====
+PDF_TEXT_DIR = os.path.join(CACHE_DIR, "pdf_text")
+PDF_WORKERS = int(os.getenv("SCANDIDAI_PDF_WORKERS", min(4, os.cpu_count() or 1)))
+PDF_TIMEOUT = float(os.getenv("SCANDIDAI_PDF_TIMEOUT", "20"))
+PDF_MAX_PAGES = int(os.getenv("SCANDIDAI_PDF_MAX_PAGES", "20"))
+PDF_MAX_BYTES = int(os.getenv("SCANDIDAI_PDF_MAX_BYTES", str(10 * 1024 * 1024)))
+
+# ===== LLM response cache =====
+LLM_CACHE_DB = os.getenv("SCANDIDAI_LLM_CACHE_DB", os.path.join(CACHE_DIR, "llm_cache.db"))
+LLM_CACHE_TTL = float(os.getenv("SCANDIDAI_LLM_CACHE_TTL", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_BYTES = int(os.getenv("SCANDIDAI_LLM_CACHE_MAX_BYTES", str(100 * 1024 * 1024)))
+
+# ===== Groq request scheduler =====
+LLM_MAX_IN_FLIGHT = int(os.getenv("SCANDIDAI_LLM_MAX_IN_FLIGHT", "4"))
+LLM_TOKENS_PER_MINUTE = int(os.getenv("SCANDIDAI_LLM_TOKENS_PER_MINUTE", "12000"))
+LLM_EXPECTED_OUTPUT_TOKENS = int(os.getenv("SCANDIDAI_LLM_EXPECTED_OUTPUT_TOKENS", "1024"))
+LLM_MAX_RETRIES = int(os.getenv("SCANDIDAI_LLM_MAX_RETRIES", "4"))
+
+# ===== Metrics =====
+METRICS_FILE = os.getenv("SCANDIDAI_METRICS_FILE", os.path.join(CACHE_DIR, "metrics.prom"))
+METRICS_PORT = int(os.getenv("SCANDIDAI_METRICS_PORT", "0"))
+# Default hanya localhost; "0.0.0.0" supaya bisa di-scrape dari mesin lain
+METRICS_HOST = os.getenv("SCANDIDAI_METRICS_HOST", "127.0.0.1")
+# Siapa pun bisa register dengan username apa saja, jadi tidak ada admin
+# default: daftar recruiter harus di-set eksplisit
+ADMIN_USERS = [name.strip() for name in os.getenv("SCANDIDAI_ADMIN_USERS", "").split(",") if name.strip()]
+
+# ===== Embedding backend =====
+# torch       : SentenceTransformer fp32 (default, sama seperti sebelumnya)
+# torch-int8  : dynamic int8 quantization untuk layer Linear (CPU)
+# onnx        : ONNX Runtime (butuh `pip install "sentence-transformers[onnx]"`)
+# onnx-int8   : ONNX Runtime dengan model quantized dari repo model (EMBEDDING_ONNX_FILE)
+EMBEDDING_MODEL = os.getenv("SCANDIDAI_EMBEDDING_MODEL", "sentence-transformers/all-mpnet-base-v2")
+EMBEDDING_BACKEND = os.getenv("SCANDIDAI_EMBEDDING_BACKEND", "torch")
+EMBEDDING_ONNX_FILE = os.getenv("SCANDIDAI_EMBEDDING_ONNX_FILE", "onnx/model_quint8_avx2.onnx")
@@ -0,0 +1,247 @@
+# dataset.py
+# Build dataset resume gabungan (pengganti merge di test.ipynb):
+#
+#   python -m scandidai.dataset build
+#
+# Kedua sumber dibaca per chunk, teks diperbaiki (mojibake seperti
+# "NaÃ¯ve" -> "Naïve"), kolom diberi dtype ringkas (kategori untuk kolom
+# berulang), resume duplikat dibuang berdasarkan hash, lalu ditulis ke
+# Parquet per row group. Build hanya diulang kalau isi file sumber (atau
+# BUILD_VERSION) berubah.
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+
+from scandidai.config import DATASET_PATH
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Naikkan kalau logika build berubah, supaya output lama dibangun ulang
+BUILD_VERSION = 1
+
+# (path relatif ke root repo, rename kolom, nama source)
+SOURCES = [
+    ("AI_Resume_Screening.csv", {}, "ai_resume_screening"),
+    ("ResumeDataSet.csv", {"Resume": "Resume Text", "Category": "Job Category"}, "resume_dataset"),
+]
+
+# Urutan kolom sama dengan combined_resume_dataset_aligned.csv lama,
+# ditambah asal baris dan hash resume.
+COLUMN_TYPES = {
+    "Resume_ID": "int32",
+    "Name": "string",
+    "Skills": "string",
+    "Experience (Years)": "int8",
+    "Education": "category",
+    "Certifications": "category",
+    "Job Role": "category",
+    "Recruiter Decision": "category",
+    "Salary Expectation ($)": "int32",
+    "Projects Count": "int8",
+    "AI Score (0-100)": "int8",
+    "Job Category": "category",
+    "Resume Text": "string",
+    "Source": "category",
+    "Resume Hash": "string",
+}
+TEXT_COLUMNS = ["Name", "Skills", "Education", "Certifications", "Job Role", "Recruiter Decision", "Job Category", "Resume Text"]
+
+# ===== Text normalization =====
+# Teks UTF-8 yang pernah dibaca sebagai cp1252/latin-1: setiap karakter asli
+# jadi 2-4 karakter di rentang ini ("â€¢" untuk "•").
+_CP1252_EXTRA = "ŒœŠšŸŽžƒˆ˜–—‘’‚“”„†‡•…‰‹›€™"
+_MOJIBAKE = re.compile(f"[Â-ô][\u0080-¿{_CP1252_EXTRA}]+")
+_WHITESPACE = re.compile(r"[ \t\u00a0]+")
+
+def _char_to_byte(char):
+    try:
+        return char.encode("cp1252")
+    except UnicodeEncodeError:
+        # 0x81, 0x8d, 0x8f, 0x90, 0x9d tidak ada di cp1252
+        return char.encode("latin-1")
+
+def _fix_run(match):
+    run = match.group(0)
+    try:
+        raw = b"".join(_char_to_byte(char) for char in run)
+        return raw.decode("utf-8")
+    except UnicodeError:
+        return run
+
+def fix_text(text):
+    if not isinstance(text, str):
+        return text
+    # Beberapa resume ter-encode dua kali, jadi ulangi sampai stabil
+    for _ in range(3):
+        fixed = _MOJIBAKE.sub(_fix_run, text)
+        if fixed == text:
+            break
+        text = fixed
+    text = unicodedata.normalize("NFC", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+def resume_hash(row):
+    # Duplikat = nama (kalau ada) dan teks resume sama setelah normalisasi
+    from scandidai.batch import resume_text_from_row
+
+    name = row.get("Name")
+    text = " ".join(resume_text_from_row(row).lower().split())
+    key = f"{name if isinstance(name, str) else ''}\0{text}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+# ===== Build =====
+def _file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+def _manifest_path(output):
+    return f"{output}.manifest.json"
+
+def _manifest(base_dir):
+    return {
+        "version": BUILD_VERSION,
+        "sources": {path: _file_sha256(os.path.join(base_dir, path)) for path, _, _ in SOURCES},
+    }
+
+def is_up_to_date(output=DATASET_PATH, base_dir=ROOT):
+    if not os.path.exists(output) or not os.path.exists(_manifest_path(output)):
+        return False
+    with open(_manifest_path(output)) as f:
+        return json.load(f) == _manifest(base_dir)
+
+def _arrow_schema():
+    import pyarrow as pa
+
+    arrow_types = {
+        "int8": pa.int8(),
+        "int32": pa.int32(),
+        "string": pa.string(),
+        "category": pa.dictionary(pa.int32(), pa.string()),
+    }
+    return pa.schema([(column, arrow_types[dtype]) for column, dtype in COLUMN_TYPES.items()])
+
+def _prepare_chunk(chunk, rename, source, seen):
+    import pandas as pd
+
+    chunk = chunk.rename(columns=rename)
+    for column in COLUMN_TYPES:
+        if column not in chunk.columns:
+            chunk[column] = None
+    for column in TEXT_COLUMNS:
+        chunk[column] = chunk[column].map(fix_text)
+    chunk["Source"] = source
+
+    records = chunk.to_dict("records")
+    hashes = [resume_hash(row) for row in records]
+    keep = []
+    for digest in hashes:
+        keep.append(digest not in seen)
+        seen.add(digest)
+    chunk["Resume Hash"] = hashes
+    chunk = chunk.loc[keep, list(COLUMN_TYPES)]
+
+    for column, dtype in COLUMN_TYPES.items():
+        if dtype.startswith("int"):
+            chunk[column] = pd.to_numeric(chunk[column], errors="coerce").astype(dtype.capitalize())
+        else:
+            chunk[column] = chunk[column].astype(dtype)
+    return chunk
+
+def build_dataset(output=DATASET_PATH, base_dir=ROOT, chunk_size=500, force=False):
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if not force and is_up_to_date(output, base_dir):
+        print(f"{output} is up to date")
+        return output
+
+    started = time.perf_counter()
+    schema = _arrow_schema()
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{output}.tmp"
+    seen = set()
+    rows_in = rows_out = 0
+    with pq.ParquetWriter(tmp_path, schema, compression="zstd") as writer:
+        for path, rename, source in SOURCES:
+            reader = pd.read_csv(os.path.join(base_dir, path), chunksize=chunk_size, dtype=str, encoding="utf-8")
+            for chunk in reader:
+                rows_in += len(chunk)
+                chunk = _prepare_chunk(chunk, rename, source, seen)
+                rows_out += len(chunk)
+                if len(chunk):
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+    os.replace(tmp_path, output)
+
+    with open(_manifest_path(output), "w") as f:
+        json.dump(_manifest(base_dir), f, indent=2)
+    print(
+        f"{output}: {rows_out} rows ({rows_in - rows_out} duplicates dropped) "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    return output
+
+def ensure_dataset(output=DATASET_PATH, base_dir=ROOT):
+    if not is_up_to_date(output, base_dir):
+        build_dataset(output, base_dir)
+    return output
+
+# ===== Read =====
+def _pandas_types():
+    # Integer Arrow -> nullable integer pandas (bukan float64 karena NaN)
+    import pandas as pd
+    import pyarrow as pa
+
+    return {pa.int8(): pd.Int8Dtype(), pa.int32(): pd.Int32Dtype()}.get
+
+def iter_dataset(path, chunk_size=1000):
+    # Chunk DataFrame dari Parquet hasil build atau CSV lama; index baris
+    # berlanjut antar chunk (dipakai sebagai nomor baris di output batch).
+    import pandas as pd
+
+    if not path.endswith(".parquet"):
+        yield from pd.read_csv(path, chunksize=chunk_size)
+        return
+
+    import pyarrow.parquet as pq
+
+    start = 0
+    types_mapper = _pandas_types()
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        chunk = batch.to_pandas(types_mapper=types_mapper)
+        chunk.index = pd.RangeIndex(start, start + len(chunk))
+        start += len(chunk)
+        yield chunk
+
+def load_dataset(path=None, columns=None):
+    import pandas as pd
+
+    if path is None:
+        path = ensure_dataset()
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path, columns=columns).to_pandas(types_mapper=_pandas_types())
+    return pd.read_csv(path, usecols=columns)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the combined resume dataset")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="merge the source CSVs into Parquet")
+    build.add_argument("--output", default=DATASET_PATH)
+    build.add_argument("--chunk-size", type=int, default=500, help="source rows read at a time")
+    build.add_argument("--force", action="store_true", help="rebuild even if the inputs did not change")
+    args = parser.parse_args()
+
+    sys.path.append(ROOT)
+    build_dataset(args.output, chunk_size=args.chunk_size, force=args.force)
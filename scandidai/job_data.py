@@ -0,0 +1,73 @@
+# job_data.py
+# Daftar lowongan. Modul ini hanya berisi data (tanpa import Streamlit),
+# jadi aman di-import oleh halaman, worker, dan CLI.
+#
+# "id" dipakai sebagai key job di antrean, results store, dan cache, jadi
+# jangan diubah setelah job dipublikasikan.
+jobs = [
+    {
+        "id": "data-engineer",
+        "title": "Data Engineer",
+        "company": "EY (Ernst & Young LLP)",
+        "location": "Jakarta, Indonesia",
+        "posted": "August 12th 2025",
+        "type": "Full-time",
+        "legacy_results_csv": "screening_results_de.csv",
+        "skills": ["SQL", "Power BI", "Data Analysis", "Data Processing", "Data Visualization", "Dashboard", "Data Quality", "Consulting"],
+        "description": """
+**About EY**  
+EY is a global leader operating in 150+ countries, delivering consulting services and helping clients transform capabilities. We aim to build a better working world through trust, innovation, and long-term value creation.
+
+**Requirements**  
+- Bachelor’s degree in Information Systems, Computer Science, Informatics, or related field.  
+- 1–2 years (Associate) or 3–5 years (Senior) in data engineering.  
+
+**Responsibilities**  
+- Collect, process, and analyze large datasets.  
+- Develop and maintain dashboards/reports using Microsoft Power BI.  
+- Collaborate with teams to identify data needs.  
+- Conduct data quality assessments and ensure integrity.  
+
+**Technical Skills**  
+- Data collection, processing & analysis  
+- Identifying trends & patterns  
+- Data visualization/dashboard development  
+- Data quality & integrity assurance  
+
+**Tools**  
+- Power BI  
+- SQL-based databases  
+
+**Soft Skills**  
+- Teamwork, adaptability, strong communication, consulting experience
+        """,
+    },
+    {
+        "id": "data-scientist",
+        "title": "Data Scientist",
+        "company": "PT Astra International Tbk",
+        "location": "Jakarta, Indonesia",
+        "posted": "June 12th 2025",
+        "type": "Full-time",
+        "legacy_results_csv": "screening_results_ds.csv",
+        "skills": ["Statistics", "Mathematics", "Statistical Analysis", "Predictive Modeling", "Data Cleaning", "Data Visualization", "Dashboard", "Leadership"],
+        "description": """
+**About the Role**  
+Responsible for building systems and tools to collect, clean, and distribute data from various sources, performing statistical analysis, and preparing visualizations to understand trends and patterns.
+
+**Requirements**  
+- Bachelor’s degree in Statistics, Mathematics, Computer Science, or Information Systems.  
+- Preferably 1+ years’ experience; open to fresh graduates.  
+- Strong analytical and conceptual thinking.  
+- High motivation, integrity, and leadership potential.  
+
+**Responsibilities**  
+- Develop predictive models and perform statistical analyses.  
+- Prepare reports and dashboards for business insights.  
+- Collaborate with teams for data-driven decision-making.  
+
+**Soft Skills**  
+- Discipline, quick learner, positive attitude, leadership skills
+        """,
+    }
+]
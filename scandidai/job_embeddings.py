@@ -0,0 +1,61 @@
+# job_embeddings.py
+import hashlib
+import os
+import sys
+import threading
+
+import numpy as np
+
+from scandidai.config import JOB_EMBEDDING_DIR
+from scandidai.model import ATS_BACKEND, ATS_MODEL_KEY, ATS_MODEL_NAME, get_ats_model, model_key
+
+# ===== Job description embedding store =====
+# Embedding job description disimpan di disk dengan key hash(model/backend + teks),
+# jadi hanya dihitung ulang kalau teks di `jobs` berubah.
+_embeddings = {}
+_embeddings_lock = threading.Lock()
+
+def job_embedding_key(job_desc, key=ATS_MODEL_KEY):
+    return hashlib.sha256(f"{key}\n{job_desc}".encode("utf-8")).hexdigest()
+
+def _embedding_path(key):
+    return os.path.join(JOB_EMBEDDING_DIR, f"{key}.npy")
+
+def get_job_embedding(job_desc, model_name=ATS_MODEL_NAME, backend=ATS_BACKEND):
+    key = job_embedding_key(job_desc, model_key(model_name, backend))
+    embedding = _embeddings.get(key)
+    if embedding is not None:
+        return embedding
+
+    with _embeddings_lock:
+        embedding = _embeddings.get(key)
+        if embedding is not None:
+            return embedding
+
+        path = _embedding_path(key)
+        if os.path.exists(path):
+            embedding = np.load(path)
+        else:
+            model = get_ats_model(model_name, backend)
+            embedding = model.encode([job_desc], normalize_embeddings=True)[0].astype(np.float32)
+            os.makedirs(JOB_EMBEDDING_DIR, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, embedding)
+            os.replace(tmp_path, path)
+
+        _embeddings[key] = embedding
+    return embedding
+
+def build_job_embeddings(jobs, model_name=ATS_MODEL_NAME, backend=ATS_BACKEND):
+    for job in jobs:
+        get_job_embedding(job["description"], model_name, backend)
+
+# ===== CLI: precompute embeddings for every job =====
+if __name__ == "__main__":
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from scandidai.job_data import jobs
+
+    build_job_embeddings(jobs)
+    for job in jobs:
+        print(f"{job['title']}: {job_embedding_key(job['description'])}")
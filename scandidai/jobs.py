@@ -0,0 +1,101 @@
+# jobs.py
+# Registry job dari scandidai/job_data.py, dengan key "id" yang stabil. Semua
+# halaman, worker, dan CLI mengambil job lewat sini, dan artefak per job
+# (embedding deskripsi, template prompt, daftar skill, cascade, leaderboard)
+# disimpan di cache bersama yang sudah ada, bukan per halaman. Artefak
+# dibangun lazy saat job pertama kali dipakai, jadi menambah job di
+# job_data.py tidak menambah memori atau waktu startup.
+import functools
+import threading
+
+_profiles = None
+_profiles_lock = threading.Lock()
+
+class UnknownJobError(KeyError):
+    pass
+
+class JobProfile:
+    def __init__(self, job):
+        self.job = job
+        self.id = job["id"]
+        self.title = job["title"]
+        self.company = job["company"]
+        self.description = job["description"]
+        self.legacy_results_csv = job.get("legacy_results_csv")
+
+    @property
+    def label(self):
+        return f"{self.title} – {self.company}"
+
+    @property
+    def embedding(self):
+        from scandidai.job_embeddings import get_job_embedding
+
+        return get_job_embedding(self.description)
+
+    @property
+    def prompt_template(self):
+        from scandidai.report import prompt_template
+
+        return prompt_template(self.description)
+
+    @functools.cached_property
+    def skills(self):
+        # Skill yang dicek prefilter leksikal (scandidai.skills)
+        from scandidai.skills import job_skills
+
+        return job_skills(self.description, self.job.get("skills", []))
+
+    @property
+    def cascade(self):
+        from scandidai.cascade import CascadePolicy
+
+        return CascadePolicy.for_job(self.job)
+
+    @property
+    def leaderboard(self):
+        from scandidai.leaderboard import get_leaderboard
+
+        return get_leaderboard(self.id)
+
+    def import_legacy_results(self):
+        # CSV hasil lama (sebelum results store) di-import sekali ke SQLite
+        if not self.legacy_results_csv:
+            return 0
+        from scandidai.results_store import import_results_csv
+
+        return import_results_csv(self.id, self.legacy_results_csv)
+
+def _load_profiles():
+    global _profiles
+    if _profiles is None:
+        with _profiles_lock:
+            if _profiles is None:
+                from scandidai.job_data import jobs
+
+                profiles = {}
+                for job in jobs:
+                    if job["id"] in profiles:
+                        raise ValueError(f"Duplicate job id in job_data.py: {job['id']}")
+                    profiles[job["id"]] = JobProfile(job)
+                _profiles = profiles
+    return _profiles
+
+def all_jobs():
+    return list(_load_profiles().values())
+
+def get_job(job_id):
+    profile = _load_profiles().get(job_id)
+    if profile is None:
+        raise UnknownJobError(job_id)
+    return profile
+
+def find_job(key):
+    # Id ("data-engineer") atau judul ("Data Engineer"), untuk CLI
+    profiles = _load_profiles()
+    if key in profiles:
+        return profiles[key]
+    for profile in profiles.values():
+        if profile.title.lower() == key.lower():
+            return profile
+    raise UnknownJobError(key)
@@ -0,0 +1,109 @@
+# leaderboard.py
+import heapq
+import threading
+
+from scandidai.config import RESULTS_DB
+from scandidai.results_store import get_connection
+
+# final_score selalu dibulatkan 2 desimal, jadi rank cukup dihitung dari
+# jumlah skor per bucket 0.01 (Fenwick tree berukuran tetap). Cosine
+# similarity bisa negatif (begitu juga skor fast_rejected = ATS / 2), jadi
+# bucket mencakup [-1, 1].
+SCORE_MIN = -1.0
+SCORE_MAX = 1.0
+SCORE_BUCKETS = int(round((SCORE_MAX - SCORE_MIN) * 100)) + 1
+TOP_K = 10
+
+def _bucket(final_score):
+    return min(max(int(round((final_score - SCORE_MIN) * 100)), 0), SCORE_BUCKETS - 1)
+
+class _FenwickTree:
+    def __init__(self, size):
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, index, delta=1):
+        index += 1
+        while index <= self.size:
+            self.tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, index):
+        # jumlah bucket 0..index-1
+        total = 0
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+# ===== Leaderboard per job =====
+class Leaderboard:
+    def __init__(self, top_k=TOP_K):
+        self.top_k = top_k
+        self.count = 0
+        self._heap = []
+        self._scores = _FenwickTree(SCORE_BUCKETS)
+        self._lock = threading.Lock()
+
+    def add(self, row):
+        final_score = row["final_score"]
+        # Skor sama: kandidat yang lebih dulu masuk tetap di atas
+        entry = (final_score, -row["id"], row)
+        with self._lock:
+            self.count += 1
+            self._scores.add(_bucket(final_score))
+            if len(self._heap) < self.top_k:
+                heapq.heappush(self._heap, entry)
+            elif entry[:2] > self._heap[0][:2]:
+                heapq.heapreplace(self._heap, entry)
+
+    def rank(self, final_score):
+        # Sama seperti rank(ascending=False, method='min')
+        with self._lock:
+            higher = self.count - self._scores.prefix_sum(_bucket(final_score) + 1)
+        return higher + 1
+
+    def top(self):
+        with self._lock:
+            entries = sorted(self._heap, key=lambda entry: entry[:2], reverse=True)
+        results = []
+        for _, _, row in entries:
+            result = dict(row)
+            result["rank"] = self.rank(row["final_score"])
+            results.append(result)
+        return results
+
+    def __len__(self):
+        return self.count
+
+# ===== Sync dengan results store =====
+# Tiap proses membangun leaderboard sekali dari database, lalu hanya
+# membaca baris baru (id > id terakhir), termasuk yang ditulis proses lain.
+_leaderboards = {}
+_last_ids = {}
+_sync_lock = threading.Lock()
+
+def _sync(db_path):
+    with _sync_lock:
+        last_id = _last_ids.get(db_path, 0)
+        rows = get_connection(db_path).execute(
+            """
+            SELECT id, job, username, timestamp, bert_score, groq_score, final_score, status, report_hash
+            FROM screening_results
+            WHERE id > ?
+            ORDER BY id
+            """,
+            (last_id,),
+        )
+        for row in rows:
+            last_id = row["id"]
+            if row["final_score"] is None:
+                continue
+            board = _leaderboards.setdefault((db_path, row["job"]), Leaderboard())
+            board.add(dict(row))
+        _last_ids[db_path] = last_id
+
+def get_leaderboard(job, db_path=RESULTS_DB):
+    _sync(db_path)
+    with _sync_lock:
+        return _leaderboards.setdefault((db_path, job), Leaderboard())
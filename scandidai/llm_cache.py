@@ -0,0 +1,106 @@
+# llm_cache.py
+# Cache jawaban LLM di SQLite (dipakai bersama oleh semua worker Streamlit),
+# key = hash(model + prompt), dengan TTL dan batas ukuran (LRU eviction).
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from scandidai.config import LLM_CACHE_DB, LLM_CACHE_MAX_BYTES, LLM_CACHE_TTL
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache (last_access);
+"""
+
+_local = threading.local()
+
+def _get_connection(db_path):
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get(db_path)
+    if conn is None:
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        connections[db_path] = conn
+    return conn
+
+def cache_key(prompt, model):
+    return hashlib.sha256(f"{model}\n{prompt}".encode("utf-8")).hexdigest()
+
+class LLMCache:
+    def __init__(self, db_path=LLM_CACHE_DB, ttl=LLM_CACHE_TTL, max_bytes=LLM_CACHE_MAX_BYTES):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+    def get(self, prompt, model):
+        key = cache_key(prompt, model)
+        conn = _get_connection(self.db_path)
+        now = time.time()
+        row = conn.execute(
+            "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        response, created_at = row
+        with conn:
+            if now - created_at > self.ttl:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+        return response
+
+    def put(self, prompt, model, response):
+        key = cache_key(prompt, model)
+        size = len(response.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        conn = _get_connection(self.db_path)
+        now = time.time()
+        with conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_cache (key, model, response, size, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (key, model, response, size, now, now),
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn, now):
+        conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl,))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Hapus entri yang paling lama tidak dipakai sampai di bawah batas
+        rows = conn.execute("SELECT key, size FROM llm_cache ORDER BY last_access")
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM llm_cache WHERE key = ?", evicted)
+
+_cache = None
+
+def get_llm_cache():
+    global _cache
+    if _cache is None:
+        _cache = LLMCache()
+    return _cache
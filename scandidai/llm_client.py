@@ -0,0 +1,143 @@
+# llm_client.py
+# Satu lapisan Groq per proses server:
+# - satu client (connection pool httpx dipakai ulang),
+# - batas jumlah request yang berjalan bersamaan,
+# - budget token per menit (token bucket),
+# - retry dengan exponential backoff + jitter untuk rate limit / error sementara.
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from scandidai.config import (
+    GROQ_API_KEY,
+    GROQ_BASE_URL,
+    LLM_EXPECTED_OUTPUT_TOKENS,
+    LLM_MAX_IN_FLIGHT,
+    LLM_MAX_RETRIES,
+    LLM_TOKENS_PER_MINUTE,
+)
+
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+
+def _retryable_errors():
+    import groq
+
+    return (
+        groq.RateLimitError,
+        groq.APIConnectionError,
+        groq.APITimeoutError,
+        groq.InternalServerError,
+    )
+
+def estimate_tokens(messages):
+    # Perkiraan kasar: ~4 karakter per token, ditambah perkiraan output
+    prompt_chars = sum(len(message["content"]) for message in messages)
+    return prompt_chars // 4 + LLM_EXPECTED_OUTPUT_TOKENS
+
+class LLMScheduler:
+    def __init__(self, max_in_flight=LLM_MAX_IN_FLIGHT, tokens_per_minute=LLM_TOKENS_PER_MINUTE,
+                 max_retries=LLM_MAX_RETRIES):
+        self.max_in_flight = max_in_flight
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._slots = threading.Semaphore(max_in_flight)
+        self._state_lock = threading.Lock()
+        self._tokens = float(tokens_per_minute)
+        self._tokens_updated = time.monotonic()
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    from groq import Groq
+
+                    # Retry diatur di sini, bukan oleh SDK
+                    self._client = Groq(api_key=GROQ_API_KEY, base_url=GROQ_BASE_URL, max_retries=0)
+        return self._client
+
+    # ===== Token budget =====
+    def _take_tokens(self, tokens):
+        tokens = min(tokens, self.tokens_per_minute)
+        rate = self.tokens_per_minute / 60.0
+        while True:
+            with self._state_lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.tokens_per_minute,
+                    self._tokens + (now - self._tokens_updated) * rate,
+                )
+                self._tokens_updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / rate
+            time.sleep(wait)
+
+    # ===== Slot =====
+    @contextmanager
+    def _slot(self, tokens):
+        self._slots.acquire()
+        try:
+            self._take_tokens(tokens)
+            yield
+        finally:
+            self._slots.release()
+
+    def _backoff(self, attempt, error):
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                return float(retry_after) + random.uniform(0, 1)
+            except ValueError:
+                pass
+        return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+    # ===== Requests =====
+    def create(self, messages, model, **kwargs):
+        tokens = estimate_tokens(messages)
+        retryable_errors = _retryable_errors()
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self._slot(tokens):
+                    return self.client.chat.completions.create(messages=messages, model=model, **kwargs)
+            except retryable_errors as e:
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self._backoff(attempt, e))
+
+    def stream(self, messages, model, **kwargs):
+        # Retry hanya sebelum chunk pertama; setelah itu error diteruskan
+        tokens = estimate_tokens(messages)
+        retryable_errors = _retryable_errors()
+        for attempt in range(self.max_retries + 1):
+            started_streaming = False
+            try:
+                with self._slot(tokens):
+                    stream = self.client.chat.completions.create(
+                        messages=messages, model=model, stream=True, **kwargs
+                    )
+                    for chunk in stream:
+                        started_streaming = True
+                        yield chunk
+                return
+            except retryable_errors as e:
+                if started_streaming or attempt == self.max_retries:
+                    raise
+                time.sleep(self._backoff(attempt, e))
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+def get_llm_scheduler():
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = LLMScheduler()
+    return _scheduler
@@ -0,0 +1,243 @@
+# metrics.py
+# Timer dan counter ringan untuk hot path aplikasi, diekspor dalam format
+# teks Prometheus:
+# - file (SCANDIDAI_METRICS_FILE, ditulis ulang paling sering tiap 5 detik),
+#   cocok untuk node_exporter textfile collector;
+# - endpoint HTTP /metrics kalau SCANDIDAI_METRICS_PORT di-set (bind ke
+#   SCANDIDAI_METRICS_HOST, default 127.0.0.1).
+# Setiap proses (Streamlit, worker antrean) menyimpan state-nya sendiri di
+# folder metrics.d/ di sebelah file .prom; file .prom, endpoint HTTP, dan
+# panel admin memakai gabungan semua proses.
+import functools
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scandidai.config import METRICS_FILE, METRICS_HOST, METRICS_PORT
+
+PREFIX = "scandidai"
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+EXPORT_INTERVAL = 5.0
+
+class _Histogram:
+    def __init__(self):
+        self.bucket_counts = [0] * len(BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.bucket_counts[i] += 1
+
+_lock = threading.Lock()
+_histograms = {}
+_counters = {}
+_last_export = 0.0
+
+def _new_process_id():
+    # pid + waktu start, supaya pid yang dipakai ulang tidak menimpa state lama
+    return f"{os.getpid()}-{int(time.time())}"
+
+_process_id = _new_process_id()
+
+def _after_fork():
+    # Proses anak (worker --processes N) mulai dari nol dengan id sendiri:
+    # angka parent sudah tercatat di file state parent
+    global _lock, _last_export, _process_id
+    _lock = threading.Lock()
+    _histograms.clear()
+    _counters.clear()
+    _last_export = 0.0
+    _process_id = _new_process_id()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+# ===== Recording =====
+def observe(name, seconds):
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = _Histogram()
+        histogram.observe(seconds)
+    _maybe_export()
+
+def increment(name, value=1):
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+    _maybe_export()
+
+@contextmanager
+def timer(name):
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        increment(f"{name}_errors")
+        raise
+    finally:
+        observe(name, time.perf_counter() - started)
+
+def timed(name):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# ===== Export =====
+def _local_state():
+    with _lock:
+        return {
+            "histograms": {name: [list(h.bucket_counts), h.count, h.sum] for name, h in _histograms.items()},
+            "counters": dict(_counters),
+        }
+
+def _process_dir(path=METRICS_FILE):
+    return f"{os.path.splitext(path)[0]}.d"
+
+def _atomic_write(path, text):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def combined_state(path=METRICS_FILE):
+    # State proses ini (terbaru) + state yang diekspor proses lain
+    local = _local_state()
+    if not path:
+        return local
+    states = [local]
+    own_file = f"{_process_id}.json"
+    for state_path in glob.glob(os.path.join(_process_dir(path), "*.json")):
+        if os.path.basename(state_path) == own_file:
+            continue
+        try:
+            with open(state_path) as f:
+                states.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+
+    combined = {"histograms": {}, "counters": {}}
+    for state in states:
+        for name, (bucket_counts, count, total) in state["histograms"].items():
+            merged = combined["histograms"].setdefault(name, [[0] * len(BUCKETS), 0, 0.0])
+            merged[0] = [a + b for a, b in zip(merged[0], bucket_counts)]
+            merged[1] += count
+            merged[2] += total
+        for name, value in state["counters"].items():
+            combined["counters"][name] = combined["counters"].get(name, 0) + value
+    return combined
+
+def render_prometheus(state=None):
+    if state is None:
+        state = combined_state()
+    histograms, counters = state["histograms"], state["counters"]
+
+    lines = []
+    for name in sorted(histograms):
+        bucket_counts, count, total = histograms[name]
+        metric = f"{PREFIX}_{name}_seconds"
+        lines.append(f"# TYPE {metric} histogram")
+        for bound, bucket_count in zip(BUCKETS, bucket_counts):
+            lines.append(f'{metric}_bucket{{le="{bound}"}} {bucket_count}')
+        lines.append(f'{metric}_bucket{{le="+Inf"}} {count}')
+        lines.append(f"{metric}_sum {total:.6f}")
+        lines.append(f"{metric}_count {count}")
+    for name in sorted(counters):
+        metric = f"{PREFIX}_{name}_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {counters[name]}")
+    return "\n".join(lines) + "\n"
+
+def snapshot():
+    # Ringkasan untuk panel admin (gabungan semua proses): satu baris per timer
+    state = combined_state()
+    counters = state["counters"]
+    rows = [
+        {
+            "metric": name,
+            "count": count,
+            "avg_ms": total / count * 1000 if count else 0.0,
+            "errors": counters.get(f"{name}_errors", 0),
+        }
+        for name, (_, count, total) in sorted(state["histograms"].items())
+    ]
+    counters = {name: value for name, value in counters.items() if not name.endswith("_errors")}
+    return rows, counters
+
+def export_textfile(path=METRICS_FILE):
+    # State proses ini ke <path>.d/, lalu gabungan semua proses ke path
+    local = _local_state()
+    _atomic_write(os.path.join(_process_dir(path), f"{_process_id}.json"), json.dumps(local))
+    _atomic_write(path, render_prometheus(combined_state(path)))
+
+def _maybe_export():
+    global _last_export
+    if not METRICS_FILE:
+        return
+    now = time.monotonic()
+    if now - _last_export < EXPORT_INTERVAL:
+        return
+    _last_export = now
+    flush()
+
+def flush():
+    # Ekspor sekarang, tanpa menunggu EXPORT_INTERVAL (mis. sebelum worker exit)
+    if not METRICS_FILE:
+        return
+    try:
+        export_textfile()
+    except OSError:
+        pass
+
+# ===== HTTP endpoint =====
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+_server = None
+_server_lock = threading.Lock()
+
+def start_metrics_server(port=METRICS_PORT, host=METRICS_HOST):
+    # Dipanggil dari app; hanya proses pertama yang berhasil bind port
+    global _server
+    if not port:
+        return None
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            except OSError:
+                return None
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, daemon=True).start()
+    return _server
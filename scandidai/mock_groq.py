@@ -0,0 +1,180 @@
+# mock_groq.py
+# Server lokal pengganti endpoint chat-completions Groq, untuk load test dan
+# benchmark tanpa kuota Groq / internet.
+#
+#   python -m scandidai.mock_groq --port 8765 --latency 1.5 --error-rate 0.05
+#   GROQ_BASE_URL=http://127.0.0.1:8765 GROQ_API_KEY=mock streamlit run app.py
+#
+# Report yang dikembalikan berisi skor x/10 (deterministik per prompt), jadi
+# extract_scores dan perhitungan skor akhir berjalan seperti biasa.
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CHAT_COMPLETIONS_PATH = "/openai/v1/chat/completions"
+
+REPORT_POINTS = [
+    "Educational background",
+    "Years of relevant experience",
+    "SQL and database skills",
+    "Data visualization / dashboarding",
+    "Statistical analysis and modelling",
+    "Data quality and integrity",
+    "Communication and teamwork",
+]
+
+def canned_report(prompt):
+    rng = random.Random(hashlib.sha256(prompt.encode("utf-8")).hexdigest())
+    lines = ["Here's the analysis of the candidate's resume and open question answer based on the job description:", ""]
+    for point in rng.sample(REPORT_POINTS, k=rng.randint(4, len(REPORT_POINTS))):
+        score = rng.randint(2, 9)
+        emoji = "✅" if score >= 7 else "⚠️" if score >= 5 else "❌"
+        lines.append(f"{emoji} **{point}**: {score}/10 - mock evaluation of this requirement.")
+    lines += [
+        "",
+        "Suggestions to improve your application:",
+        "1. Quantify the impact of your previous projects.",
+        "2. Highlight tools that are listed in the job description.",
+    ]
+    return "\n".join(lines)
+
+class MockGroqHandler(BaseHTTPRequestHandler):
+    server_version = "MockGroq/1.0"
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.path.rstrip("/") != CHAT_COMPLETIONS_PATH:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        config = self.server
+        with config.stats_lock:
+            config.stats["requests"] += 1
+
+        # Simulasi error: 429 (rate limit) atau 500 sesuai --error-rate
+        if random.random() < config.error_rate:
+            with config.stats_lock:
+                config.stats["errors"] += 1
+            if random.random() < 0.5:
+                self._send_json(429, {"error": {"message": "Rate limit reached (mock)", "type": "tokens"}},
+                                {"retry-after": "1"})
+            else:
+                self._send_json(500, {"error": {"message": "Internal server error (mock)"}})
+            return
+
+        prompt = "\n".join(message.get("content", "") for message in request.get("messages", []))
+        report = canned_report(prompt)
+        model = request.get("model", "mock")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+        time.sleep(max(0.0, random.gauss(config.latency, config.jitter)))
+
+        if request.get("stream"):
+            self._stream(report, completion_id, created, model)
+        else:
+            self._send_json(200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": report},
+                    "finish_reason": "stop",
+                    "logprobs": None,
+                }],
+                "usage": {
+                    "prompt_tokens": len(prompt) // 4,
+                    "completion_tokens": len(report) // 4,
+                    "total_tokens": (len(prompt) + len(report)) // 4,
+                },
+            })
+
+    def _stream(self, report, completion_id, created, model):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        def send_chunk(delta, finish_reason=None):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason, "logprobs": None}],
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        chunk_size = self.server.chunk_size
+        delay = chunk_size / self.server.chars_per_second if self.server.chars_per_second else 0
+        send_chunk({"role": "assistant", "content": ""})
+        for start in range(0, len(report), chunk_size):
+            send_chunk({"content": report[start:start + chunk_size]})
+            if delay:
+                time.sleep(delay)
+        send_chunk({}, "stop")
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+def make_server(host="127.0.0.1", port=8765, latency=1.0, jitter=0.0, error_rate=0.0,
+                chunk_size=16, chars_per_second=400.0, quiet=False):
+    server = ThreadingHTTPServer((host, port), MockGroqHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.jitter = jitter
+    server.error_rate = error_rate
+    server.chunk_size = chunk_size
+    server.chars_per_second = chars_per_second
+    server.quiet = quiet
+    server.stats = {"requests": 0, "errors": 0}
+    server.stats_lock = threading.Lock()
+    return server
+
+def start_in_background(**kwargs):
+    # Untuk benchmark/test: jalankan server di thread daemon, return (server, base_url)
+    server = make_server(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    return server, f"http://{host}:{port}"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local mock of the Groq chat-completions endpoint")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=1.0, help="seconds before the first byte")
+    parser.add_argument("--jitter", type=float, default=0.0, help="std-dev of the latency (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 429/500")
+    parser.add_argument("--chunk-size", type=int, default=16, help="characters per streamed chunk")
+    parser.add_argument("--chars-per-second", type=float, default=400.0, help="streaming speed, 0 = no delay")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.latency, args.jitter, args.error_rate,
+                         args.chunk_size, args.chars_per_second, args.quiet)
+    print(f"Mock Groq listening on http://{args.host}:{args.port} (set GROQ_BASE_URL to this)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
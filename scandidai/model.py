@@ -0,0 +1,58 @@
+# model.py
+import threading
+import time
+
+from scandidai.config import EMBEDDING_BACKEND, EMBEDDING_MODEL, EMBEDDING_ONNX_FILE
+from scandidai.metrics import observe
+
+ATS_MODEL_NAME = EMBEDDING_MODEL
+ATS_BACKEND = EMBEDDING_BACKEND
+EMBEDDING_BACKENDS = ("torch", "torch-int8", "onnx", "onnx-int8")
+
+def model_key(model_name=ATS_MODEL_NAME, backend=ATS_BACKEND):
+    # Identitas embedding untuk cache (job embedding, resume index): skor
+    # dari backend berbeda tidak boleh tercampur.
+    return model_name if backend == "torch" else f"{model_name}@{backend}"
+
+ATS_MODEL_KEY = model_key()
+
+# ===== Backends =====
+def _load_model(model_name, backend):
+    # Import di sini: sentence_transformers (torch) butuh beberapa detik,
+    # jadi hanya dibayar saat model benar-benar dipakai.
+    from sentence_transformers import SentenceTransformer
+
+    if backend == "torch":
+        return SentenceTransformer(model_name)
+    if backend == "torch-int8":
+        import torch
+
+        model = SentenceTransformer(model_name, device="cpu")
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    if backend == "onnx":
+        return SentenceTransformer(model_name, backend="onnx")
+    if backend == "onnx-int8":
+        return SentenceTransformer(model_name, backend="onnx", model_kwargs={"file_name": EMBEDDING_ONNX_FILE})
+    raise ValueError(f"Unknown embedding backend {backend!r}, expected one of {', '.join(EMBEDDING_BACKENDS)}")
+
+# ===== Shared ATS model =====
+# Module ini di-import sekali per proses server, jadi model di sini dipakai
+# bersama oleh semua session dan kedua halaman screening.
+_models = {}
+_models_lock = threading.Lock()
+
+def get_ats_model(model_name=ATS_MODEL_NAME, backend=ATS_BACKEND):
+    key = model_key(model_name, backend)
+    model = _models.get(key)
+    if model is None:
+        with _models_lock:
+            model = _models.get(key)
+            if model is None:
+                started = time.perf_counter()
+                model = _load_model(model_name, backend)
+                observe("model_load", time.perf_counter() - started)
+                _models[key] = model
+    return model
+
+def is_ats_model_loaded(model_name=ATS_MODEL_NAME, backend=ATS_BACKEND):
+    return model_key(model_name, backend) in _models
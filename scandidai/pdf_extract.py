@@ -0,0 +1,122 @@
+# pdf_extract.py
+# Ekstraksi teks PDF di process pool terpisah, dengan batas waktu dan jumlah
+# halaman, plus cache di disk berdasarkan SHA-256 isi file.
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from scandidai.config import PDF_MAX_BYTES, PDF_MAX_PAGES, PDF_TEXT_DIR, PDF_TIMEOUT, PDF_WORKERS
+
+class PdfExtractionError(Exception):
+    pass
+
+# ===== Worker =====
+def _extract_in_worker(data, max_pages):
+    from pdfminer.high_level import extract_text
+
+    return extract_text(io.BytesIO(data), maxpages=max_pages)
+
+# ===== Pool =====
+_pool = None
+_pool_lock = threading.Lock()
+# Paling banyak PDF_WORKERS task di pool: task langsung jalan begitu
+# di-submit, jadi timeout hanya mengukur waktu parsing, bukan antrean
+_slots = threading.BoundedSemaphore(PDF_WORKERS)
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=PDF_WORKERS)
+        return _pool
+
+def _reset_pool(pool):
+    # ProcessPoolExecutor tidak bisa membatalkan task yang sedang jalan,
+    # jadi worker yang macet dimatikan dan pool diganti baru.
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    # _processes jadi None kalau thread lain sudah men-shutdown pool ini
+    for process in list((getattr(pool, "_processes", None) or {}).values()):
+        process.kill()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def shutdown_pool():
+    # Dipanggil proses worker antrean sebelum exit: proses anak
+    # multiprocessing tidak menjalankan atexit concurrent.futures, jadi tanpa
+    # ini proses menunggu worker pool selamanya.
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+# ===== Cache =====
+def _cache_path(digest):
+    return os.path.join(PDF_TEXT_DIR, f"{digest}.txt")
+
+def _read_cache(digest):
+    path = _cache_path(digest)
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    return None
+
+def _write_cache(digest, text):
+    # Nama tmp unik per panggilan (beberapa thread bisa menulis PDF yang
+    # sama). Cache hanya optimasi: kalau gagal ditulis, teks tetap dipakai.
+    tmp_path = None
+    try:
+        os.makedirs(PDF_TEXT_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=PDF_TEXT_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, _cache_path(digest))
+    except OSError as e:
+        print(f"[pdf_extract] could not cache text for {digest}: {e}", file=sys.stderr)
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _extract_with_retry(data, timeout, max_pages):
+    for attempt in range(2):
+        pool = _get_pool()
+        try:
+            future = pool.submit(_extract_in_worker, data, max_pages)
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            _reset_pool(pool)
+            raise PdfExtractionError(f"PDF parsing took longer than {timeout:g}s")
+        except BrokenProcessPool:
+            # Pool dimatikan karena PDF lain timeout (atau worker crash):
+            # coba sekali lagi di pool baru.
+            _reset_pool(pool)
+            if attempt:
+                raise PdfExtractionError("PDF worker crashed while parsing this file")
+
+# ===== Public API =====
+def extract_pdf_bytes(data, timeout=PDF_TIMEOUT, max_pages=PDF_MAX_PAGES):
+    if len(data) > PDF_MAX_BYTES:
+        raise PdfExtractionError(f"PDF is larger than {PDF_MAX_BYTES // (1024 * 1024)} MB")
+
+    digest = hashlib.sha256(data).hexdigest()
+    text = _read_cache(digest)
+    if text is not None:
+        return text
+
+    with _slots:
+        try:
+            text = _extract_with_retry(data, timeout, max_pages)
+        except PdfExtractionError:
+            raise
+        except Exception as e:
+            raise PdfExtractionError(str(e)) from e
+
+    _write_cache(digest, text)
+    return text
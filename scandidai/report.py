@@ -0,0 +1,127 @@
+# report.py
+import functools
+import re
+import time
+
+from scandidai.config import GROQ_MODEL
+from scandidai.llm_cache import get_llm_cache
+from scandidai.llm_client import get_llm_scheduler
+from scandidai.metrics import increment, observe, timed
+
+SCORE_PATTERN = re.compile(r'(\d+(?:\.\d+)?)/10')
+
+# ===== Prompt =====
+PROMPT_TEMPLATE = """
+    # Context:
+    - You are an AI Resume Analyzer, you will be given a candidate's resume + their answer to the open question, and the job description.
+
+    # Instruction:
+    - Analyze based on required skills, experience, and qualifications in the job description.
+    - Give each relevant point a score out of 5 at the start with an emoji (✅ match, ❌ not match, ⚠️ unclear).
+    - End with "Suggestions to improve your application:" followed by clear improvement tips.
+
+    # Inputs:
+    Candidate Submission: {resume_and_answer}
+    ---
+    Job Description: {job_desc}
+
+    # Output:
+    - Each any every point should be given a score (example: 6/10 ).
+    - If the candicate is not relevant, give score below 5/10
+    - Final improvement suggestions.
+    """
+
+# Bagian prompt sebelum dan sesudah submission kandidat, dengan job
+# description sudah terisi; dihitung sekali per job.
+@functools.lru_cache(maxsize=64)
+def prompt_template(job_desc):
+    before, after = PROMPT_TEMPLATE.split("{resume_and_answer}")
+    return before, after.replace("{job_desc}", job_desc)
+
+def build_prompt(resume_and_answer, job_desc):
+    before, after = prompt_template(job_desc)
+    return before + resume_and_answer + after
+
+# ===== Groq report =====
+# Prompt yang sama (resume + jawaban + job) dalam TTL cache tidak memanggil
+# Groq lagi.
+@timed("llm_report")
+def get_report(resume_and_answer, job_desc):
+    prompt = build_prompt(resume_and_answer, job_desc)
+    cache = get_llm_cache()
+    report = cache.get(prompt, GROQ_MODEL)
+    if report is not None:
+        increment("llm_cache_hits")
+        return report
+    increment("llm_cache_misses")
+
+    chat_completion = get_llm_scheduler().create(
+        messages=[{"role": "user", "content": prompt}],
+        model=GROQ_MODEL,
+    )
+    report = chat_completion.choices[0].message.content
+    cache.put(prompt, GROQ_MODEL, report)
+    return report
+
+def stream_report(resume_and_answer, job_desc):
+    prompt = build_prompt(resume_and_answer, job_desc)
+    cache = get_llm_cache()
+    report = cache.get(prompt, GROQ_MODEL)
+    if report is not None:
+        increment("llm_cache_hits")
+        yield report
+        return
+    increment("llm_cache_misses")
+
+    started = time.perf_counter()
+    stream = get_llm_scheduler().stream(
+        messages=[{"role": "user", "content": prompt}],
+        model=GROQ_MODEL,
+    )
+    chunks = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        content = chunk.choices[0].delta.content
+        if content:
+            if not chunks:
+                observe("llm_first_chunk", time.perf_counter() - started)
+            chunks.append(content)
+            yield content
+    observe("llm_stream", time.perf_counter() - started)
+    # Hanya stream yang selesai penuh yang masuk cache
+    cache.put(prompt, GROQ_MODEL, "".join(chunks))
+
+# ===== Score extraction =====
+def extract_scores(text):
+    matches = SCORE_PATTERN.findall(text)
+    return [float(match) for match in matches]
+
+def average_score(scores):
+    return sum(scores) / (10 * len(scores)) if scores else 0
+
+class ReportScoreTracker:
+    # Mengumpulkan skor x/10 selama report di-stream. Match yang menempel di
+    # ujung teks belum dihitung karena chunk berikutnya masih bisa
+    # memperpanjangnya; close() menghitung ulang dari teks lengkap.
+    def __init__(self):
+        self.text = ""
+        self.scores = []
+        self.closed = False
+        self._scanned = 0
+
+    def feed(self, chunk):
+        self.text += chunk
+        for match in SCORE_PATTERN.finditer(self.text, self._scanned):
+            if match.end() == len(self.text):
+                break
+            self.scores.append(float(match.group(1)))
+            self._scanned = match.end()
+
+    def close(self):
+        self.scores = extract_scores(self.text)
+        self.closed = True
+
+    @property
+    def average(self):
+        return average_score(self.scores)
@@ -0,0 +1,48 @@
+# report_store.py
+# Report LLM disimpan di luar tabel skor: satu file gzip per report, nama
+# file = SHA-256 isi report (report identik hanya disimpan sekali). Tabel
+# screening_results cukup menyimpan hash-nya, jadi leaderboard/ranking
+# tidak pernah membaca teks report; report dibaca hanya kalau dibuka.
+import gzip
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+
+from scandidai.config import REPORT_STORE_DIR
+
+def report_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def _report_path(digest, store_dir):
+    return os.path.join(store_dir, digest[:2], f"{digest}.md.gz")
+
+def store_report(text, store_dir=REPORT_STORE_DIR):
+    if not text:
+        return None
+    digest = report_hash(text)
+    path = _report_path(digest, store_dir)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Nama tmp unik per panggilan: report yang sama bisa disimpan
+        # beberapa thread sekaligus
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8", compresslevel=9) as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    return digest
+
+# Isi file tidak pernah berubah untuk hash yang sama, jadi aman di-cache
+@lru_cache(maxsize=128)
+def load_report(digest, store_dir=REPORT_STORE_DIR):
+    if not digest:
+        return None
+    try:
+        with gzip.open(_report_path(digest, store_dir), "rt", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
@@ -0,0 +1,227 @@
+# results_store.py
+import csv
+import io
+import os
+import sqlite3
+import sys
+import threading
+
+from scandidai.config import RESULTS_DB
+from scandidai.metrics import timed
+from scandidai.report_store import load_report, store_report
+
+RESULT_COLUMNS = ["username", "timestamp", "bert_score", "groq_score", "final_score", "status", "report"]
+
+# ===== Connection =====
+# SQLite dalam mode WAL: append satu baris = satu INSERT, beberapa session
+# bisa menulis bersamaan tanpa saling menimpa, dan pembaca tidak diblok.
+# Tabelnya hanya berisi skor (schema sama untuk semua job); teks report ada
+# di scandidai.report_store dan dirujuk lewat report_hash.
+_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready = set()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS screening_results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job TEXT NOT NULL,
+    submission_id TEXT,
+    username TEXT,
+    timestamp TEXT,
+    bert_score REAL,
+    groq_score REAL,
+    final_score REAL,
+    status TEXT NOT NULL DEFAULT 'evaluated',
+    report_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_job_final_score
+    ON screening_results (job, final_score DESC);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_results_submission
+    ON screening_results (job, username, submission_id);
+CREATE TABLE IF NOT EXISTS csv_imports (
+    job TEXT NOT NULL,
+    path TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    PRIMARY KEY (job, path)
+);
+"""
+
+def get_connection(db_path=RESULTS_DB):
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with _schema_lock:
+            if db_path not in _schema_ready:
+                conn.executescript(SCHEMA)
+                _migrate_inline_reports(conn)
+                _migrate_status_column(conn)
+                _schema_ready.add(db_path)
+        connections[db_path] = conn
+    return conn
+
+def _migrate_status_column(conn):
+    # status: "evaluated" (dinilai LLM) atau "fast_rejected" (scandidai.cascade)
+    columns = [row["name"] for row in conn.execute("PRAGMA table_info(screening_results)")]
+    if "status" not in columns:
+        with conn:
+            conn.execute("ALTER TABLE screening_results ADD COLUMN status TEXT NOT NULL DEFAULT 'evaluated'")
+
+def _migrate_inline_reports(conn):
+    # Database lama menyimpan report di kolom `report`: pindahkan ke report
+    # store dan bangun ulang tabel tanpa kolom itu.
+    columns = [row["name"] for row in conn.execute("PRAGMA table_info(screening_results)")]
+    if "report" not in columns:
+        return
+    hashes = [
+        (store_report(row["report"]), row["id"])
+        for row in conn.execute("SELECT id, report FROM screening_results WHERE report IS NOT NULL")
+    ]
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute("DROP INDEX IF EXISTS idx_results_job_final_score")
+        conn.execute("DROP INDEX IF EXISTS idx_results_submission")
+        conn.execute("ALTER TABLE screening_results RENAME TO screening_results_inline")
+        for statement in SCHEMA.split(";"):
+            if statement.strip():
+                conn.execute(statement)
+        conn.execute(
+            """
+            INSERT INTO screening_results
+                (id, job, submission_id, username, timestamp, bert_score, groq_score, final_score)
+            SELECT id, job, submission_id, username, timestamp, bert_score, groq_score, final_score
+            FROM screening_results_inline
+            """
+        )
+        conn.executemany("UPDATE screening_results SET report_hash = ? WHERE id = ?", hashes)
+        conn.execute("DROP TABLE screening_results_inline")
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.execute("VACUUM")
+
+# ===== Write =====
+@timed("save_result")
+def add_result(job, result, submission_id=None, db_path=RESULTS_DB):
+    # submission_id membuat insert idempotent: submission yang sama dari
+    # user yang sama tidak menambah baris kedua.
+    conn = get_connection(db_path)
+    with conn:
+        cursor = conn.execute(
+            """
+            INSERT OR IGNORE INTO screening_results
+                (job, submission_id, username, timestamp, bert_score, groq_score, final_score, status, report_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                job,
+                submission_id,
+                result.get("username"),
+                result.get("timestamp"),
+                result.get("bert_score"),
+                result.get("groq_score"),
+                result.get("final_score"),
+                result.get("status") or "evaluated",
+                store_report(result.get("report")),
+            ),
+        )
+    return cursor.rowcount == 1
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def import_results_csv(job, csv_path, db_path=RESULTS_DB):
+    # Import CSV lama sekali saja per (job, path).
+    conn = get_connection(db_path)
+    if conn.execute(
+        "SELECT 1 FROM csv_imports WHERE job = ? AND path = ?", (job, csv_path)
+    ).fetchone():
+        return 0
+    if not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0:
+        return 0
+
+    rows = []
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            rows.append((
+                job,
+                row.get("username"),
+                row.get("timestamp"),
+                _to_float(row.get("bert_score")),
+                _to_float(row.get("groq_score")),
+                _to_float(row.get("final_score")),
+                row.get("status") or "evaluated",
+                store_report(row.get("report")),
+            ))
+
+    with conn:
+        if conn.execute(
+            "SELECT 1 FROM csv_imports WHERE job = ? AND path = ?", (job, csv_path)
+        ).fetchone():
+            return 0
+        conn.executemany(
+            """
+            INSERT INTO screening_results
+                (job, username, timestamp, bert_score, groq_score, final_score, status, report_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        conn.execute(
+            "INSERT INTO csv_imports (job, path, rows) VALUES (?, ?, ?)",
+            (job, csv_path, len(rows)),
+        )
+    return len(rows)
+
+# ===== Read =====
+def cascade_stats(job=None, db_path=RESULTS_DB):
+    # Jumlah hasil per status; fast_rejected = panggilan LLM yang dihemat
+    query = "SELECT status, COUNT(*) FROM screening_results"
+    params = ()
+    if job is not None:
+        query += " WHERE job = ?"
+        params = (job,)
+    stats = {"evaluated": 0, "fast_rejected": 0}
+    rows = get_connection(db_path).execute(query + " GROUP BY status", params).fetchall()
+    stats.update({status: count for status, count in rows})
+    return stats
+
+def export_results_csv(job, csv_path=None, db_path=RESULTS_DB):
+    # Format CSV lama (termasuk teks report), dibaca dari report store
+    conn = get_connection(db_path)
+    rows = conn.execute(
+        f"SELECT {', '.join(RESULT_COLUMNS[:-1])}, report_hash FROM screening_results WHERE job = ? ORDER BY id",
+        (job,),
+    )
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(RESULT_COLUMNS)
+    for row in rows:
+        writer.writerow(list(row)[:-1] + [load_report(row["report_hash"])])
+    if csv_path is not None:
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            f.write(buffer.getvalue())
+    return buffer.getvalue()
+
+# ===== CLI =====
+# python -m scandidai.results_store import data-engineer screening_results_de.csv
+# python -m scandidai.results_store export data-engineer hasil.csv
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] not in ("import", "export"):
+        print("Usage: python -m scandidai.results_store import|export <job> <csv_path>")
+        sys.exit(1)
+    command, job, path = sys.argv[1:]
+    if command == "import":
+        print(f"Imported {import_results_csv(job, path)} rows into {job}")
+    else:
+        export_results_csv(job, path)
+        print(f"Exported {job} to {path}")
@@ -0,0 +1,41 @@
+# scoring.py
+from functools import lru_cache
+
+import numpy as np
+
+from scandidai.job_embeddings import get_job_embedding
+from scandidai.metrics import timed
+from scandidai.model import get_ats_model
+
+# ===== Candidate embeddings =====
+@lru_cache(maxsize=64)
+def encode_candidate(text):
+    # Di-cache supaya teks yang sama (misalnya saat dimasukkan ke resume
+    # index setelah di-skor) tidak di-encode dua kali.
+    embedding = get_ats_model().encode([text], normalize_embeddings=True)[0].astype(np.float32)
+    embedding.setflags(write=False)
+    return embedding
+
+def encode_candidates(texts, batch_size=64):
+    return get_ats_model().encode(
+        list(texts),
+        batch_size=batch_size,
+        normalize_embeddings=True,
+        convert_to_numpy=True,
+    ).astype(np.float32)
+
+# ===== Similarity =====
+@timed("similarity")
+def calculate_similarity_bert(text1, text2):
+    # text2 adalah job description: embedding-nya diambil dari store,
+    # jadi yang di-encode hanya teks kandidat.
+    job_embedding = get_job_embedding(text2)
+    candidate_embedding = encode_candidate(text1)
+    return float(np.dot(candidate_embedding, job_embedding))
+
+def calculate_similarity_bert_batch(texts, job_descs, batch_size=64):
+    # Versi batch untuk banyak resume sekaligus: tiap resume di-encode sekali,
+    # lalu dikalikan dengan semua embedding job -> matriks (resume x job).
+    job_matrix = np.stack([get_job_embedding(job_desc) for job_desc in job_descs])
+    candidate_matrix = encode_candidates(texts, batch_size=batch_size)
+    return candidate_matrix @ job_matrix.T
@@ -0,0 +1,319 @@
+# screening_queue.py
+# Antrean submission screening di SQLite. Halaman Streamlit hanya
+# memasukkan submission (PDF + jawaban) lalu mem-poll statusnya; worker
+# (scandidai.worker) mengambil task, menjalankan pipeline, dan menulis
+# progres + hasil kembali ke sini. Karena tersimpan di disk, refresh browser
+# atau restart Streamlit tidak membuang pekerjaan yang sedang berjalan.
+#
+# Status: queued -> running -> done / fast_rejected (ditolak cascade tanpa
+# LLM, scandidai.cascade) / failed. Task "running" yang worker-nya berhenti
+# mengirim heartbeat lebih lama dari QUEUE_LEASE diambil ulang worker lain
+# (maksimal QUEUE_MAX_ATTEMPTS kali).
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+from scandidai.config import QUEUE_DB, QUEUE_LEASE, QUEUE_MAX_ATTEMPTS
+
+ACTIVE_STATUSES = ("queued", "running")
+
+# Kolom yang ditampilkan ke halaman (tanpa blob PDF)
+TASK_COLUMNS = (
+    "id, job, username, status, attempts, worker, error, ats_score, avg_score, "
+    "final_score, skills, report, timestamp, created_at, started_at, finished_at"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS screening_tasks (
+    id TEXT PRIMARY KEY,
+    job TEXT NOT NULL,
+    username TEXT NOT NULL,
+    job_desc TEXT NOT NULL,
+    open_question TEXT NOT NULL,
+    resume_pdf BLOB,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    error TEXT,
+    ats_score REAL,
+    avg_score REAL,
+    final_score REAL,
+    skills TEXT,
+    report TEXT,
+    timestamp TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    heartbeat_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status_created
+    ON screening_tasks (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_user_job
+    ON screening_tasks (username, job, created_at);
+CREATE TABLE IF NOT EXISTS queue_workers (
+    worker_id TEXT PRIMARY KEY,
+    started_at REAL NOT NULL,
+    heartbeat_at REAL NOT NULL
+);
+"""
+
+# ===== Connection =====
+_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready = set()
+
+def get_connection(db_path=QUEUE_DB):
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get(db_path)
+    if conn is None:
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Autocommit; claim_task membuka transaksi sendiri (BEGIN IMMEDIATE)
+        conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with _schema_lock:
+            if db_path not in _schema_ready:
+                conn.executescript(SCHEMA)
+                _migrate_skills_column(conn)
+                _schema_ready.add(db_path)
+        connections[db_path] = conn
+    return conn
+
+def _migrate_skills_column(conn):
+    # Database lama belum punya kolom skills (hasil prefilter skill, JSON)
+    columns = [row["name"] for row in conn.execute("PRAGMA table_info(screening_tasks)")]
+    if "skills" not in columns:
+        conn.execute("ALTER TABLE screening_tasks ADD COLUMN skills TEXT")
+
+def _task_dict(row):
+    task = dict(row)
+    if task.get("skills"):
+        task["skills"] = json.loads(task["skills"])
+    return task
+
+def task_key(job, username, resume_pdf, open_question):
+    h = hashlib.sha256()
+    for part in (job.encode("utf-8"), username.encode("utf-8"), resume_pdf, open_question.encode("utf-8")):
+        h.update(part)
+        h.update(b"\0")
+    return h.hexdigest()
+
+# ===== Page side =====
+def enqueue(job, username, job_desc, resume_pdf, open_question, db_path=QUEUE_DB):
+    # Submit ganda (double click, rerun) menghasilkan task yang sama;
+    # submission identik yang dulu gagal diantrekan ulang.
+    task_id = task_key(job, username, resume_pdf, open_question)
+    now = time.time()
+    conn = get_connection(db_path)
+    conn.execute(
+        """
+        INSERT OR IGNORE INTO screening_tasks
+            (id, job, username, job_desc, open_question, resume_pdf, status, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, 'queued', ?)
+        """,
+        (task_id, job, username, job_desc, open_question, resume_pdf, now),
+    )
+    conn.execute(
+        """
+        UPDATE screening_tasks
+        SET status = 'queued', attempts = 0, worker = NULL, error = NULL,
+            resume_pdf = ?, created_at = ?, finished_at = NULL
+        WHERE id = ? AND status = 'failed'
+        """,
+        (resume_pdf, now, task_id),
+    )
+    return task_id
+
+def get_task(task_id, db_path=QUEUE_DB):
+    row = get_connection(db_path).execute(
+        f"SELECT {TASK_COLUMNS} FROM screening_tasks WHERE id = ?", (task_id,)
+    ).fetchone()
+    return _task_dict(row) if row else None
+
+def active_task(username, job, db_path=QUEUE_DB):
+    # Task terakhir user untuk job ini yang belum selesai (setelah refresh)
+    row = get_connection(db_path).execute(
+        """
+        SELECT id FROM screening_tasks
+        WHERE username = ? AND job = ? AND status IN ('queued', 'running')
+        ORDER BY created_at DESC LIMIT 1
+        """,
+        (username, job),
+    ).fetchone()
+    return row["id"] if row else None
+
+def queue_position(task, db_path=QUEUE_DB):
+    row = get_connection(db_path).execute(
+        "SELECT COUNT(*) FROM screening_tasks WHERE status = 'queued' AND created_at < ?",
+        (task["created_at"],),
+    ).fetchone()
+    return row[0] + 1
+
+def estimated_wait(task, recent=20, db_path=QUEUE_DB):
+    # Posisi antrean x rata-rata durasi task terakhir, dibagi jumlah task
+    # yang sedang berjalan (perkiraan kapasitas worker). None kalau belum
+    # ada riwayat.
+    conn = get_connection(db_path)
+    row = conn.execute(
+        """
+        SELECT AVG(finished_at - started_at) FROM (
+            SELECT started_at, finished_at FROM screening_tasks
+            WHERE status IN ('done', 'fast_rejected') AND started_at IS NOT NULL
+            ORDER BY finished_at DESC LIMIT ?
+        )
+        """,
+        (recent,),
+    ).fetchone()
+    if row[0] is None:
+        return None
+    running = conn.execute("SELECT COUNT(*) FROM screening_tasks WHERE status = 'running'").fetchone()[0]
+    return queue_position(task, db_path) * row[0] / max(running, 1)
+
+def queue_stats(db_path=QUEUE_DB):
+    rows = get_connection(db_path).execute(
+        "SELECT status, COUNT(*) FROM screening_tasks GROUP BY status"
+    ).fetchall()
+    stats = {"queued": 0, "running": 0, "done": 0, "fast_rejected": 0, "failed": 0}
+    stats.update({status: count for status, count in rows})
+    return stats
+
+# ===== Worker side =====
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+def register_worker(worker_id, db_path=QUEUE_DB):
+    now = time.time()
+    get_connection(db_path).execute(
+        "INSERT OR REPLACE INTO queue_workers (worker_id, started_at, heartbeat_at) VALUES (?, ?, ?)",
+        (worker_id, now, now),
+    )
+
+def unregister_worker(worker_id, db_path=QUEUE_DB):
+    get_connection(db_path).execute("DELETE FROM queue_workers WHERE worker_id = ?", (worker_id,))
+
+def heartbeat(worker_id, db_path=QUEUE_DB):
+    # Menandai worker masih hidup dan memperpanjang lease task-nya
+    now = time.time()
+    conn = get_connection(db_path)
+    conn.execute("UPDATE queue_workers SET heartbeat_at = ? WHERE worker_id = ?", (now, worker_id))
+    conn.execute(
+        "UPDATE screening_tasks SET heartbeat_at = ? WHERE worker = ? AND status = 'running'",
+        (now, worker_id),
+    )
+
+def live_workers(max_age=QUEUE_LEASE, db_path=QUEUE_DB):
+    rows = get_connection(db_path).execute(
+        "SELECT worker_id FROM queue_workers WHERE heartbeat_at >= ?", (time.time() - max_age,)
+    ).fetchall()
+    return [row["worker_id"] for row in rows]
+
+def claim_task(worker_id, lease=QUEUE_LEASE, max_attempts=QUEUE_MAX_ATTEMPTS, db_path=QUEUE_DB):
+    now = time.time()
+    expired = now - lease
+    conn = get_connection(db_path)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Lease habis dan sudah terlalu sering dicoba: jangan diulang lagi
+        conn.execute(
+            """
+            UPDATE screening_tasks
+            SET status = 'failed', error = 'Worker stopped while processing this submission',
+                resume_pdf = NULL, finished_at = ?
+            WHERE status = 'running' AND heartbeat_at < ? AND attempts >= ?
+            """,
+            (now, expired, max_attempts),
+        )
+        row = conn.execute(
+            """
+            SELECT id FROM screening_tasks
+            WHERE status = 'queued' OR (status = 'running' AND heartbeat_at < ?)
+            ORDER BY created_at LIMIT 1
+            """,
+            (expired,),
+        ).fetchone()
+        if row is not None:
+            conn.execute(
+                """
+                UPDATE screening_tasks
+                SET status = 'running', worker = ?, attempts = attempts + 1, started_at = ?,
+                    heartbeat_at = ?, ats_score = NULL, avg_score = NULL, skills = NULL, report = NULL
+                WHERE id = ?
+                """,
+                (worker_id, now, now, row["id"]),
+            )
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    if row is None:
+        return None
+    return dict(conn.execute("SELECT * FROM screening_tasks WHERE id = ?", (row["id"],)).fetchone())
+
+def update_progress(task_id, worker_id, report=None, ats_score=None, avg_score=None, skills=None, db_path=QUEUE_DB):
+    # False: task sudah diambil alih worker lain (lease habis)
+    cursor = get_connection(db_path).execute(
+        """
+        UPDATE screening_tasks
+        SET heartbeat_at = ?, report = COALESCE(?, report),
+            ats_score = COALESCE(?, ats_score), avg_score = COALESCE(?, avg_score),
+            skills = COALESCE(?, skills)
+        WHERE id = ? AND worker = ? AND status = 'running'
+        """,
+        (time.time(), report, ats_score, avg_score, skills and json.dumps(skills), task_id, worker_id),
+    )
+    return cursor.rowcount == 1
+
+def complete_task(task_id, worker_id, result, db_path=QUEUE_DB):
+    cursor = get_connection(db_path).execute(
+        """
+        UPDATE screening_tasks
+        SET status = ?, ats_score = ?, avg_score = ?, final_score = ?, skills = ?, report = ?,
+            timestamp = ?, error = NULL, resume_pdf = NULL, finished_at = ?
+        WHERE id = ? AND worker = ? AND status = 'running'
+        """,
+        (
+            # Kandidat yang ditolak cascade tanpa report LLM
+            "fast_rejected" if result.get("status") == "fast_rejected" else "done",
+            result["ats_score"],
+            result["avg_score"],
+            result["final_score"],
+            json.dumps(result["skills"]) if result.get("skills") else None,
+            result["report"],
+            result["timestamp"],
+            time.time(),
+            task_id,
+            worker_id,
+        ),
+    )
+    return cursor.rowcount == 1
+
+def fail_task(task_id, worker_id, error, retry=True, max_attempts=QUEUE_MAX_ATTEMPTS, db_path=QUEUE_DB):
+    conn = get_connection(db_path)
+    if retry:
+        cursor = conn.execute(
+            """
+            UPDATE screening_tasks SET status = 'queued', worker = NULL, error = ?
+            WHERE id = ? AND worker = ? AND status = 'running' AND attempts < ?
+            """,
+            (error, task_id, worker_id, max_attempts),
+        )
+        if cursor.rowcount == 1:
+            return False
+    conn.execute(
+        """
+        UPDATE screening_tasks
+        SET status = 'failed', error = ?, resume_pdf = NULL, finished_at = ?
+        WHERE id = ? AND worker = ? AND status = 'running'
+        """,
+        (error, time.time(), task_id, worker_id),
+    )
+    return True
@@ -0,0 +1,179 @@
+# skills.py
+# Prefilter leksikal sebelum BERT/LLM: coverage skill job di teks resume.
+#
+# Vocabulary = kolom Skills di AI_Resume_Screening.csv + skill yang diminta
+# job (field "skills" di scandidai/job_data.py) + alias. Semua istilah di-compile
+# jadi satu regex berbentuk trie: teks cukup di-scan sekali dan di setiap
+# posisi paling banyak satu cabang trie yang dicoba, jadi cost-nya tidak
+# naik dengan jumlah skill (mirip automaton Aho-Corasick, tanpa dependency
+# tambahan).
+#
+#   python -m scandidai.skills "I build dashboards in Power BI and SQL" --job data-engineer
+import argparse
+import csv
+import os
+import re
+import sys
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SKILLS_SOURCE = os.path.join(ROOT, "AI_Resume_Screening.csv")
+
+# Penulisan lain untuk skill yang sama (dibandingkan setelah normalize)
+ALIASES = {
+    "Pytorch": ["torch"],
+    "NLP": ["natural language processing"],
+    "Power BI": ["powerbi"],
+    "Data Visualization": ["data visualisation", "visualization", "visualisation"],
+    "Predictive Modeling": ["predictive modelling", "predictive model"],
+    "Statistical Analysis": ["statistical analyses", "statistical modeling", "statistical modelling"],
+    "Cybersecurity": ["cyber security"],
+}
+
+_SEPARATORS = re.compile(r"[\s\-_/]+")
+# Karakter yang dianggap bagian dari kata (supaya "Java" tidak match
+# "JavaScript", "SQL" tidak match "NoSQL", dan "C++" tetap utuh)
+_WORD = "a-z0-9+#"
+
+def normalize(text):
+    return _SEPARATORS.sub(" ", text.lower())
+
+def _trie_pattern(terms):
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # Istilah berhenti di sini, tapi coba yang lebih panjang dulu
+            return f"(?:{body})?" if len(branches) == 1 else body + "?"
+        return body
+
+    return build(trie)
+
+class SkillMatcher:
+    def __init__(self, skills, aliases=None):
+        # skills: nama kanonik; aliases: {nama kanonik: [alias, ...]}
+        self._lookup = {}
+        for skill in skills:
+            self._lookup.setdefault(normalize(skill), skill)
+        for skill, names in (aliases or {}).items():
+            if skill in skills:
+                for name in names:
+                    self._lookup.setdefault(normalize(name), skill)
+        self.skills = sorted(set(self._lookup.values()), key=str.lower)
+        self.index = {skill: i for i, skill in enumerate(self.skills)}
+        # Plural sederhana ("dashboards") ikut match
+        self._pattern = re.compile(f"(?<![{_WORD}])({_trie_pattern(self._lookup)})s?(?![{_WORD}])")
+
+    def find(self, text):
+        if not isinstance(text, str) or not text:
+            return set()
+        return {self._lookup[match] for match in self._pattern.findall(normalize(text))}
+
+    def canonical(self, skills):
+        # Nama skill job -> nama kanonik di vocabulary (duplikat dibuang)
+        return list(dict.fromkeys(self._lookup.get(normalize(skill), skill) for skill in skills))
+
+    def coverage(self, text, required):
+        found = self.find(text)
+        matched = [skill for skill in required if skill in found]
+        missing = [skill for skill in required if skill not in found]
+        return {
+            "coverage": len(matched) / len(required) if required else 0.0,
+            "matched": matched,
+            "missing": missing,
+        }
+
+    def matrix(self, texts):
+        # (resume, skill) boolean untuk banyak resume sekaligus
+        import numpy as np
+
+        rows, columns = [], []
+        for i, text in enumerate(texts):
+            for skill in self.find(text):
+                rows.append(i)
+                columns.append(self.index[skill])
+        result = np.zeros((len(texts), len(self.skills)), dtype=bool)
+        result[rows, columns] = True
+        return result
+
+# ===== Vocabulary =====
+def dataset_skills(path=SKILLS_SOURCE):
+    skills = set()
+    if not os.path.exists(path):
+        return skills
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            for skill in (row.get("Skills") or "").split(","):
+                if skill.strip():
+                    skills.add(skill.strip())
+    return skills
+
+_matcher = None
+_matcher_lock = threading.Lock()
+
+def get_skill_matcher():
+    global _matcher
+    if _matcher is None:
+        with _matcher_lock:
+            if _matcher is None:
+                from scandidai.jobs import all_jobs
+
+                skills = dataset_skills()
+                for job in all_jobs():
+                    skills.update(job.job.get("skills", []))
+                _matcher = SkillMatcher(skills, ALIASES)
+    return _matcher
+
+def job_skills(description, explicit=()):
+    # Skill yang diminta job: daftar "skills" di job_data.py, ditambah skill
+    # vocabulary yang disebut di deskripsinya
+    matcher = get_skill_matcher()
+    required = matcher.canonical(explicit)
+    required += sorted(matcher.find(description) - set(required), key=str.lower)
+    return required
+
+def skill_coverage(text, required):
+    return get_skill_matcher().coverage(text, required)
+
+def skill_coverage_batch(texts, required_per_job):
+    # Coverage (resume x job) untuk corpus besar: satu scan per resume,
+    # lalu perkalian matriks terhadap mask skill setiap job
+    import numpy as np
+
+    matcher = get_skill_matcher()
+    found = matcher.matrix(texts).astype(np.float32)
+    masks = np.zeros((len(required_per_job), len(matcher.skills)), dtype=np.float32)
+    for j, required in enumerate(required_per_job):
+        for skill in required:
+            if skill in matcher.index:
+                masks[j, matcher.index[skill]] = 1.0
+    counts = np.array([max(len(required), 1) for required in required_per_job], dtype=np.float32)
+    return (found @ masks.T) / counts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Match job skills in a resume text")
+    parser.add_argument("text", help="resume text, or a path to a .txt file")
+    parser.add_argument("--job", default="data-engineer", help="job id or title from scandidai/job_data.py")
+    args = parser.parse_args()
+
+    sys.path.append(ROOT)
+    from scandidai.jobs import find_job
+
+    text = args.text
+    if os.path.exists(text):
+        with open(text, encoding="utf-8") as f:
+            text = f.read()
+    job = find_job(args.job)
+    result = skill_coverage(text, job.skills)
+    print(f"{job.title}: {result['coverage']:.0%} skill coverage")
+    print(f"matched: {', '.join(result['matched']) or '-'}")
+    print(f"missing: {', '.join(result['missing']) or '-'}")
@@ -0,0 +1,11 @@
+# submission.py
+import hashlib
+
+# ===== Submission key =====
+def submission_key(resume_text, open_question, job_desc):
+    h = hashlib.sha256()
+    for part in (resume_text, open_question, job_desc):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
@@ -0,0 +1,90 @@
+# users.py
+import csv
+import os
+import threading
+import time
+
+from scandidai.file_lock import file_lock
+
+USER_COLUMNS = ["username", "password", "email"]
+
+# Berapa lama (detik) index di memori dipakai tanpa cek mtime file lagi
+STAT_INTERVAL = 1.0
+
+# ===== User repository =====
+# users.csv tetap jadi penyimpanan, tapi dibaca sekali ke index
+# {username: record} dan hanya dibaca ulang kalau mtime/ukuran file berubah.
+class UserRepository:
+    def __init__(self, path):
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self._users = {}
+        self._signature = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def init_file(self):
+        if not os.path.exists(self.path):
+            with self._lock, file_lock(self.lock_path):
+                if not os.path.exists(self.path):
+                    with open(self.path, "w", newline="", encoding="utf-8") as f:
+                        csv.writer(f).writerow(USER_COLUMNS)
+
+    def _file_signature(self):
+        stat = os.stat(self.path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _reload(self):
+        users = {}
+        with open(self.path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                # Sama seperti sebelumnya: username pertama yang menang
+                users.setdefault(row["username"], row)
+        self._users = users
+
+    def _refresh(self, force=False):
+        now = time.monotonic()
+        if not force and now - self._checked_at < STAT_INTERVAL:
+            return
+        signature = self._file_signature()
+        if signature != self._signature:
+            self._reload()
+            self._signature = signature
+        self._checked_at = now
+
+    def load(self):
+        with self._lock:
+            self._refresh()
+            return self._users
+
+    def get(self, username):
+        return self.load().get(username)
+
+    def exists(self, username):
+        return self.get(username) is not None
+
+    def add(self, username, password_hash, email):
+        # Return False kalau username sudah ada. Cek dan append dilakukan
+        # di bawah lock file, jadi aman walaupun ada beberapa proses.
+        with self._lock, file_lock(self.lock_path):
+            self._refresh(force=True)
+            if username in self._users:
+                return False
+            row = {"username": username, "password": password_hash, "email": email}
+            with open(self.path, "a", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerow([row[column] for column in USER_COLUMNS])
+                f.flush()
+                os.fsync(f.fileno())
+            self._users[username] = row
+            self._signature = self._file_signature()
+        return True
+
+_repositories = {}
+_repositories_lock = threading.Lock()
+
+def get_user_repository(path):
+    with _repositories_lock:
+        repository = _repositories.get(path)
+        if repository is None:
+            repository = _repositories[path] = UserRepository(path)
+        return repository
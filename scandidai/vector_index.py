@@ -0,0 +1,265 @@
+# vector_index.py
+# Index embedding resume (dataset + pelamar) untuk pencarian "top N kandidat
+# untuk job ini".
+#
+#   python -m scandidai.vector_index build
+#
+# Embedding disimpan ter-normalisasi di embeddings.npy yang dibuka dengan
+# memory map, jadi cosine similarity = satu perkalian matriks. float32 paling
+# cepat di-query; float16 memakai separuh disk/RAM tapi perlu konversi per blok.
+# File dialokasikan dengan kapasitas lebih, sehingga pelamar baru cukup
+# ditulis ke baris berikutnya; kapasitas digandakan kalau penuh.
+# Beberapa proses (UI + worker antrean) boleh memakai index yang sama: tulis
+# dilakukan di bawah lock file, dan setiap proses memuat ulang index kalau
+# index.json diubah proses lain.
+# Setiap model embedding (nama + backend) punya subfolder sendiri di
+# RESUME_INDEX_DIR, jadi vektor dari model berbeda tidak pernah tercampur.
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+
+import numpy as np
+
+from scandidai.config import RESUME_INDEX_DIR, RESUME_INDEX_DTYPE
+from scandidai.file_lock import file_lock
+from scandidai.model import ATS_MODEL_KEY
+
+INITIAL_CAPACITY = 1024
+QUERY_BLOCK_ROWS = 4096
+
+def model_index_dir(model_name=ATS_MODEL_KEY, root=RESUME_INDEX_DIR):
+    # "sentence-transformers/all-mpnet-base-v2@onnx" -> nama folder yang aman
+    return os.path.join(root, re.sub(r"[^A-Za-z0-9._@-]+", "_", model_name))
+
+class ResumeIndex:
+    def __init__(self, index_dir=None, dtype=RESUME_INDEX_DTYPE, model_name=ATS_MODEL_KEY):
+        self.index_dir = index_dir or model_index_dir(model_name)
+        self.dtype = np.dtype(dtype)
+        self.model_name = model_name
+        self.count = 0
+        self.metadata = []
+        self._matrix = None
+        self._signature = None
+        self._lock = threading.Lock()
+        self._load()
+
+    # ===== Files =====
+    @property
+    def _matrix_path(self):
+        return os.path.join(self.index_dir, "embeddings.npy")
+
+    @property
+    def _metadata_path(self):
+        return os.path.join(self.index_dir, "metadata.jsonl")
+
+    @property
+    def _info_path(self):
+        return os.path.join(self.index_dir, "index.json")
+
+    @property
+    def _lock_path(self):
+        return os.path.join(self.index_dir, "index.lock")
+
+    def _info_signature(self):
+        try:
+            stat = os.stat(self._info_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load(self):
+        self._matrix = None
+        self.count = 0
+        self.metadata = []
+        self._signature = self._info_signature()
+        if self._signature is None:
+            return
+        with open(self._info_path) as f:
+            info = json.load(f)
+        if info["model_name"] != self.model_name:
+            return
+        self.dtype = np.dtype(info["dtype"])
+        self.count = info["count"]
+        self._matrix = np.load(self._matrix_path, mmap_mode="r+")
+        with open(self._metadata_path, encoding="utf-8") as f:
+            self.metadata = [json.loads(line) for line in f][:self.count]
+
+    def _write_info(self):
+        info = {"model_name": self.model_name, "dtype": self.dtype.name, "count": self.count}
+        tmp_path = f"{self._info_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(info, f)
+        os.replace(tmp_path, self._info_path)
+        self._signature = self._info_signature()
+
+    def _refresh(self):
+        # Proses lain menambah/menghapus baris sejak terakhir dimuat
+        if self._info_signature() != self._signature:
+            self._load()
+
+    def _ensure_capacity(self, rows, dim):
+        capacity = 0 if self._matrix is None else self._matrix.shape[0]
+        if self.count + rows <= capacity:
+            return
+        new_capacity = max(INITIAL_CAPACITY, capacity)
+        while new_capacity < self.count + rows:
+            new_capacity *= 2
+
+        os.makedirs(self.index_dir, exist_ok=True)
+        tmp_path = f"{self._matrix_path}.tmp"
+        grown = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=self.dtype, shape=(new_capacity, dim))
+        if self.count:
+            grown[:self.count] = self._matrix[:self.count]
+        grown.flush()
+        del grown
+        self._matrix = None
+        os.replace(tmp_path, self._matrix_path)
+        self._matrix = np.load(self._matrix_path, mmap_mode="r+")
+
+    # ===== Write =====
+    def add(self, embeddings, metadata):
+        embeddings = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        if len(embeddings) != len(metadata):
+            raise ValueError("embeddings and metadata must have the same length")
+        os.makedirs(self.index_dir, exist_ok=True)
+        with self._lock, file_lock(self._lock_path):
+            self._refresh()
+            self._ensure_capacity(len(embeddings), embeddings.shape[1])
+            self._matrix[self.count:self.count + len(embeddings)] = embeddings.astype(self.dtype)
+            self._matrix.flush()
+            # Index kosong (baru, atau index.json dari model lain): metadata
+            # lama tidak boleh ikut terbaca bersama embedding baru
+            with open(self._metadata_path, "a" if self.count else "w", encoding="utf-8") as f:
+                for item in metadata:
+                    f.write(json.dumps(item, default=str) + "\n")
+            self.metadata.extend(metadata)
+            self.count += len(embeddings)
+            self._write_info()
+
+    def clear(self):
+        os.makedirs(self.index_dir, exist_ok=True)
+        with self._lock, file_lock(self._lock_path):
+            self._matrix = None
+            self.count = 0
+            self.metadata = []
+            for path in (self._matrix_path, self._metadata_path, self._info_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            self._signature = None
+
+    # ===== Query =====
+    def search(self, query_embedding, top_k=10, where=None):
+        # where: filter opsional pada metadata, misalnya {"source": "applicant"}
+        with self._lock:
+            self._refresh()
+            count = self.count
+            matrix = self._matrix
+            metadata = self.metadata
+        if not count:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        scores = np.empty(count, dtype=np.float32)
+        for start in range(0, count, QUERY_BLOCK_ROWS):
+            stop = min(start + QUERY_BLOCK_ROWS, count)
+            scores[start:stop] = np.asarray(matrix[start:stop], dtype=np.float32) @ query
+
+        if where:
+            mask = np.array([
+                all(item.get(key) == value for key, value in where.items())
+                for item in metadata[:count]
+            ], dtype=bool)
+            scores[~mask] = -np.inf
+
+        top_k = min(top_k, count)
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [
+            dict(metadata[i], score=float(scores[i]))
+            for i in candidates
+            if np.isfinite(scores[i])
+        ]
+
+    def __len__(self):
+        return self.count
+
+# ===== Shared index =====
+_index = None
+_index_lock = threading.Lock()
+
+def get_resume_index():
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = ResumeIndex()
+    return _index
+
+def top_candidates_for_job(job_desc, top_k=10, where=None):
+    from scandidai.job_embeddings import get_job_embedding
+
+    return get_resume_index().search(get_job_embedding(job_desc), top_k=top_k, where=where)
+
+def add_applicant(text, metadata):
+    from scandidai.scoring import encode_candidate
+
+    get_resume_index().add(encode_candidate(text), [dict(metadata, source="applicant")])
+
+# ===== CLI: build index dari dataset =====
+def build_from_dataset(path=None, chunk_size=1000, batch_size=64):
+    import pandas as pd
+
+    from scandidai.batch import ID_COLUMNS, resume_text_from_row
+    from scandidai.dataset import ensure_dataset, iter_dataset
+    from scandidai.scoring import encode_candidates
+
+    if path is None:
+        path = ensure_dataset()
+    index = get_resume_index()
+    # Baris dataset lama diganti, pelamar yang sudah masuk dipertahankan
+    applicants = [i for i, item in enumerate(index.metadata) if item.get("source") == "applicant"]
+    applicant_rows = np.asarray(index._matrix[applicants], dtype=np.float32) if applicants else None
+    applicant_metadata = [index.metadata[i] for i in applicants]
+    index.clear()
+
+    for chunk in iter_dataset(path, chunk_size):
+        records = chunk.to_dict("records")
+        embeddings = encode_candidates([resume_text_from_row(row) for row in records], batch_size=batch_size)
+        metadata = []
+        for row_number, row in zip(chunk.index, records):
+            item = {"source": "corpus", "row": int(row_number)}
+            for column in ID_COLUMNS:
+                value = row.get(column)
+                if value is not None and pd.notna(value):
+                    item[column] = value
+            metadata.append(item)
+        index.add(embeddings, metadata)
+        print(f"indexed {len(index)} resumes")
+
+    if applicant_rows is not None:
+        index.add(applicant_rows, applicant_metadata)
+    return index
+
+if __name__ == "__main__":
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    parser = argparse.ArgumentParser(description="Resume vector index")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build")
+    build.add_argument("--input", default=None, help="Parquet dataset or CSV (default: built dataset)")
+    build.add_argument("--chunk-size", type=int, default=1000)
+    build.add_argument("--batch-size", type=int, default=64)
+    query = subparsers.add_parser("query")
+    query.add_argument("job", help="job id or title from scandidai/job_data.py")
+    query.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        build_from_dataset(args.input, args.chunk_size, args.batch_size)
+    else:
+        from scandidai.jobs import find_job
+
+        for result in top_candidates_for_job(find_job(args.job).description, args.top):
+            print(f"{result['score']:.4f}  {result}")
@@ -0,0 +1,279 @@
+# worker.py
+# Worker antrean screening: ambil task dari scandidai.screening_queue,
+# jalankan pipeline (ekstraksi PDF, ATS score, report Groq), simpan hasil.
+#
+#   python -m scandidai.worker --processes 2 --threads 4
+#
+# Setiap proses memuat model sendiri; thread dalam satu proses berbagi model
+# dan scheduler Groq (batas SCANDIDAI_LLM_* berlaku per proses). Worker bisa
+# dijalankan di mesin/container terpisah selama memakai file database dan
+# cache yang sama.
+import argparse
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from scandidai.config import QUEUE_EMBEDDED_WORKERS, QUEUE_POLL_INTERVAL
+from scandidai.metrics import flush, increment, observe, timed, timer
+from scandidai.screening_queue import (
+    claim_task,
+    complete_task,
+    fail_task,
+    heartbeat,
+    register_worker,
+    unregister_worker,
+    update_progress,
+    worker_name,
+)
+
+HEARTBEAT_INTERVAL = 5.0
+# Report parsial ditulis ke antrean paling sering tiap PROGRESS_INTERVAL detik
+PROGRESS_INTERVAL = 0.5
+
+class TaskLost(Exception):
+    # Lease task habis dan task sudah diambil worker lain
+    pass
+
+# ===== Pipeline =====
+def job_settings(task):
+    # (skill yang dicek, cascade policy) untuk job task ini
+    from scandidai.cascade import CascadePolicy
+    from scandidai.jobs import UnknownJobError, get_job
+    from scandidai.skills import job_skills
+
+    try:
+        job = get_job(task["job"])
+    except UnknownJobError:
+        # Job sudah dihapus dari job_data.py: pakai skill dari deskripsinya
+        return job_skills(task["job_desc"]), CascadePolicy()
+    return job.skills, job.cascade
+
+@timed("screening_task")
+def process_task(task, worker_id):
+    from scandidai.cascade import EVALUATED, FAST_REJECTED, fast_reject_score, record_avoided_call
+    from scandidai.pdf_extract import extract_pdf_bytes
+    from scandidai.report import ReportScoreTracker, build_prompt, stream_report
+    from scandidai.results_store import add_result
+    from scandidai.scoring import calculate_similarity_bert
+    from scandidai.skills import skill_coverage
+    from scandidai.submission import submission_key
+    from scandidai.vector_index import add_applicant
+
+    job_desc = task["job_desc"]
+    open_question = task["open_question"]
+    with timer("extract_pdf_text"):
+        resume_text = extract_pdf_bytes(task["resume_pdf"])
+
+    combined_text = resume_text + "\n\nOpen Question Answer:\n" + open_question
+    submission_id = submission_key(resume_text, open_question, job_desc)
+
+    # Prefilter skill (mikrodetik) langsung ditampilkan di halaman
+    required, cascade = job_settings(task)
+    with timer("skill_prefilter"):
+        skills = skill_coverage(combined_text, required)
+    if not update_progress(task["id"], worker_id, skills=skills):
+        raise TaskLost(task["id"])
+
+    def save(result):
+        add_result(task["job"], result, submission_id)
+        add_applicant(combined_text, {
+            'username': task["username"],
+            'job': task["job"],
+            'timestamp': result['timestamp'],
+        })
+        return result
+
+    # BERT jalan di thread lain sementara report Groq di-stream; report
+    # parsial ditulis ke antrean supaya halaman bisa menampilkannya.
+    # Dengan cascade aktif, ATS score ditunggu dulu untuk memutuskan
+    # apakah LLM perlu dipanggil.
+    ats_score = None
+    tracker = ReportScoreTracker()
+    last_progress = 0.0
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        ats_future = executor.submit(calculate_similarity_bert, combined_text, job_desc)
+        if cascade.enabled:
+            ats_score = ats_future.result()
+            if not cascade.needs_llm(ats_score, skills["coverage"]):
+                record_avoided_call(
+                    task["job"], len(build_prompt(combined_text, job_desc)), ats_score, skills["coverage"]
+                )
+                return save({
+                    'username': task["username"],
+                    'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    'bert_score': round(ats_score, 2),
+                    'groq_score': None,
+                    'final_score': fast_reject_score(ats_score),
+                    'status': FAST_REJECTED,
+                    'report': None,
+                    'skills': skills,
+                    'ats_score': ats_score,
+                    'avg_score': None,
+                })
+            if not update_progress(task["id"], worker_id, ats_score=ats_score):
+                raise TaskLost(task["id"])
+        for chunk in stream_report(combined_text, job_desc):
+            tracker.feed(chunk)
+            if ats_score is None and ats_future.done():
+                ats_score = ats_future.result()
+            now = time.monotonic()
+            if now - last_progress >= PROGRESS_INTERVAL:
+                last_progress = now
+                if not update_progress(task["id"], worker_id, tracker.text, ats_score, tracker.average):
+                    raise TaskLost(task["id"])
+        tracker.close()
+        ats_score = ats_future.result()
+
+    avg_score = tracker.average
+    result = {
+        'username': task["username"],
+        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'bert_score': round(ats_score, 2),
+        'groq_score': round(avg_score, 2),
+        'final_score': round((ats_score + avg_score) / 2, 2),
+        'status': EVALUATED,
+        'report': tracker.text,
+        'skills': skills,
+        # Nilai asli (belum dibulatkan) untuk ditampilkan di halaman
+        'ats_score': ats_score,
+        'avg_score': avg_score,
+    }
+    return save(result)
+
+# ===== Worker =====
+class Worker:
+    def __init__(self, threads=1, worker_id=None):
+        self.threads = threads
+        self.worker_id = worker_id or worker_name()
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        register_worker(self.worker_id)
+        self._threads = [threading.Thread(target=self._heartbeat_loop, name="queue-heartbeat", daemon=True)]
+        for i in range(self.threads):
+            self._threads.append(threading.Thread(target=self._run_loop, name=f"queue-worker-{i}", daemon=True))
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        unregister_worker(self.worker_id)
+
+    def wait(self):
+        while any(thread.is_alive() for thread in self._threads):
+            for thread in self._threads:
+                thread.join(1.0)
+
+    def _heartbeat_loop(self):
+        while not self._stop.wait(HEARTBEAT_INTERVAL):
+            try:
+                heartbeat(self.worker_id)
+            except Exception as e:
+                print(f"[{self.worker_id}] heartbeat failed: {e}", file=sys.stderr)
+
+    def _run_loop(self):
+        while not self._stop.is_set():
+            try:
+                task = claim_task(self.worker_id)
+            except Exception as e:
+                print(f"[{self.worker_id}] claim failed: {e}", file=sys.stderr)
+                task = None
+            if task is None:
+                self._stop.wait(QUEUE_POLL_INTERVAL)
+                continue
+            self._run_task(task)
+
+    def _run_task(self, task):
+        from scandidai.pdf_extract import PdfExtractionError
+
+        if task["started_at"] and task["attempts"] == 1:
+            observe("queue_wait", task["started_at"] - task["created_at"])
+        try:
+            result = process_task(task, self.worker_id)
+        except TaskLost:
+            return
+        except PdfExtractionError as e:
+            # PDF rusak tidak akan berhasil kalau diulang
+            fail_task(task["id"], self.worker_id, f"Error extracting text from PDF: {e}", retry=False)
+            increment("tasks_failed")
+            return
+        except Exception as e:
+            print(f"[{self.worker_id}] task {task['id'][:12]} failed: {e!r}", file=sys.stderr)
+            if fail_task(task["id"], self.worker_id, str(e) or type(e).__name__):
+                increment("tasks_failed")
+            return
+        complete_task(task["id"], self.worker_id, result)
+        increment("submissions")
+
+def _interrupt(signum, frame):
+    # SIGTERM (docker stop, systemd) diperlakukan sama seperti Ctrl+C
+    raise KeyboardInterrupt
+
+def run_worker(threads=1):
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, _interrupt)
+    worker = Worker(threads=threads).start()
+    print(f"[{worker.worker_id}] screening worker started with {threads} thread(s)")
+    try:
+        worker.wait()
+    except KeyboardInterrupt:
+        # Berhenti sekali saja walaupun sinyal datang lagi (Ctrl+C + SIGTERM parent)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    finally:
+        worker.stop(timeout=5)
+        from scandidai.pdf_extract import shutdown_pool
+
+        shutdown_pool()
+        # Timing terakhir (< EXPORT_INTERVAL) ikut tercatat untuk panel admin
+        flush()
+
+# ===== Embedded worker (di proses Streamlit) =====
+_embedded = None
+_embedded_lock = threading.Lock()
+
+def ensure_embedded_workers(threads=QUEUE_EMBEDDED_WORKERS):
+    global _embedded
+    if threads <= 0 or _embedded is not None:
+        return _embedded
+    with _embedded_lock:
+        if _embedded is None:
+            _embedded = Worker(threads=threads).start()
+    return _embedded
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run screening queue workers")
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--threads", type=int, default=2, help="tasks processed concurrently per process")
+    args = parser.parse_args()
+
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if args.processes == 1:
+        run_worker(args.threads)
+    else:
+        signal.signal(signal.SIGTERM, _interrupt)
+        processes = [
+            multiprocessing.Process(target=run_worker, args=(args.threads,), name=f"screening-worker-{i}")
+            for i in range(args.processes)
+        ]
+        for process in processes:
+            process.start()
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            # Worker berhenti dengan rapi pada SIGTERM (task yang sedang jalan
+            # diambil ulang worker lain setelah lease habis)
+            for process in processes:
+                process.terminate()
+            for process in processes:
+                process.join()